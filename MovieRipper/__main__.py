@@ -1,41 +1,47 @@
 from __future__ import annotations
 
 import argparse
+import sys
 from pathlib import Path
 
 from . import __version__
-from .clz_index import build_index, load_index
-from .config import (
-    CONFIG_NOT_FOUND_MESSAGE,
-    init_config,
-    load_config,
-    normalize_config,
-    resolve_config_path,
-    validate_config,
-)
-from .logging_setup import configure_logging
-from .queue_ui import QueueBuilderApp
-from .watcher import run_queue
+
+# Subcommand dependencies (tkinter, the watcher, the web stack) are imported
+# inside the branch that needs them so `--help`, `--version` and `config ...`
+# stay fast.
+
+
+def _exists(p: Path) -> bool:
+    try:
+        p.stat()
+    except OSError:
+        return False
+    return True
 
 
 def smoke_test(config_path: str | None) -> int:
+    from .config import load_config, validate_config
+
     cfg, resolved, reason = load_config(config_path)
     report = validate_config(cfg)
-    normalized = normalize_config(cfg)
-    rip_prep_root = Path(normalized["rips_staging_root"])
-    rip_staging_root = Path(normalized["final_movies_root"])
-    makemkv_cmd = Path(normalized.get("makemkv_cmd", "makemkvcon64.exe"))
+    normalized = report["normalized_config"]
+    # (path, found message, missing message); each path is stat'ed once
+    checks = [
+        (Path(normalized["rips_staging_root"]), "OK path exists", "MISSING path"),
+        (Path(normalized["final_movies_root"]), "OK path exists", "MISSING path"),
+        (Path(normalized.get("makemkv_cmd", "makemkvcon64.exe")), "OK MakeMKV exists", "MISSING MakeMKV path"),
+    ]
 
     print(f"Config: {resolved} ({reason})")
     print(f"MovieRipper loaded from: {Path(__file__).resolve()}")
 
     ok = not report["errors"]
-    for p in (rip_prep_root, rip_staging_root):
-        if p.exists():
-            print(f"OK path exists: {p}")
+    for p, found, missing in checks:
+        if _exists(p):
+            print(f"{found}: {p}")
         else:
             ok = False
-            print(f"MISSING path: {p}")
+            print(f"{missing}: {p}")
 
     for warning in report["warnings"]:
         print(f"WARNING: {warning}")
@@ -43,12 +49,6 @@ def smoke_test(config_path: str | None) -> int:
     for error in report["errors"]:
         print(f"ERROR: {error}")
 
-    if makemkv_cmd.exists():
-        print(f"OK MakeMKV exists: {makemkv_cmd}")
-    else:
-        ok = False
-        print(f"MISSING MakeMKV path: {makemkv_cmd}")
-
     return 0 if ok else 1
 
 
@@ -64,51 +64,138 @@ def _start_web(host: str, port: int) -> int:
     return 0
 
 
-def main() -> None:
-    ap = argparse.ArgumentParser(prog="movieripper", description="MovieRipper (Windows, queue-driven movie ripping)")
-    ap.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
-    sub = ap.add_subparsers(dest="cmd", required=True)
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """First non-flag token in argv; None when absent or preceded by -h/--help."""
+    for token in argv:
+        if token in ("-h", "--help"):
+            return None
+        if not token.startswith("-"):
+            return token
+    return None
+
+
+def _add_import_master(sub) -> None:
+    p = sub.add_parser("import-master", help="Build index JSON from MASTEREXPORT CSV (must include CLZ Index + IMDb Url)")
+    p.add_argument("--csv", required=True, help="Path to MASTEREXPORT CSV")
+    p.add_argument("--out", required=True, help="Output index JSON path")
+    p.add_argument("--pretty", action="store_true", help="Indent the index JSON for reading (larger, slower)")
+
+
+def _add_build_queue(sub) -> None:
+    p = sub.add_parser("build-queue", help="Open Queue Builder UI (IMDb required) and save movie_queue.json")
+    p.add_argument("--index", required=True, help="Path to index JSON (from import-master)")
+    p.add_argument("--out", default="movie_queue.json", help="Default save path (you can choose another in UI)")
+
+
+def _add_run_queue(sub) -> None:
+    p = sub.add_parser("run-queue", help="Run the queue: wait for disc, rip to RIP_PREP, then move/rename into RIPS_STAGING")
+    p.add_argument("--queue", required=True, help="Path to movie_queue.json")
+    p.add_argument("--config", default=None, help="Path to config.json")
+
+
+def _add_smoke_test(sub) -> None:
+    p = sub.add_parser("smoke-test", help="Validate config paths and MakeMKV path without requiring a disc")
+    p.add_argument("--config", default=None, help="Path to config.json")
+
+
+def _add_config_where(config_sub) -> None:
+    p = config_sub.add_parser("where", help="Show resolved config path and discovery source")
+    p.add_argument("--config", default=None, help="Path to config.json")
 
-    p1 = sub.add_parser("import-master", help="Build index JSON from MASTEREXPORT CSV (must include CLZ Index + IMDb Url)")
-    p1.add_argument("--csv", required=True, help="Path to MASTEREXPORT CSV")
-    p1.add_argument("--out", required=True, help="Output index JSON path")
 
-    p2 = sub.add_parser("build-queue", help="Open Queue Builder UI (IMDb required) and save movie_queue.json")
-    p2.add_argument("--index", required=True, help="Path to index JSON (from import-master)")
-    p2.add_argument("--out", default="movie_queue.json", help="Default save path (you can choose another in UI)")
+def _add_config_init(config_sub) -> None:
+    p = config_sub.add_parser("init", help="Write config.example.json to target path")
+    p.add_argument("--path", default=None, help="Target path (default: ./config.json)")
 
-    p3 = sub.add_parser("run-queue", help="Run the queue: wait for disc, rip to RIP_PREP, then move/rename into RIPS_STAGING")
-    p3.add_argument("--queue", required=True, help="Path to movie_queue.json")
-    p3.add_argument("--config", default=None, help="Path to config.json")
 
-    p4 = sub.add_parser("smoke-test", help="Validate config paths and MakeMKV path without requiring a disc")
-    p4.add_argument("--config", default=None, help="Path to config.json")
+CONFIG_SUBCOMMANDS = {
+    "where": _add_config_where,
+    "init": _add_config_init,
+}
 
-    p5 = sub.add_parser("config", help="Config discovery and initialization")
-    config_sub = p5.add_subparsers(dest="config_cmd", required=True)
-    p5w = config_sub.add_parser("where", help="Show resolved config path and discovery source")
-    p5w.add_argument("--config", default=None, help="Path to config.json")
-    p5i = config_sub.add_parser("init", help="Write config.example.json to target path")
-    p5i.add_argument("--path", default=None, help="Target path (default: ./config.json)")
 
-    p6 = sub.add_parser("web", help="Run local web control panel")
-    p6.add_argument("--host", default="127.0.0.1", help="Host bind (default localhost only)")
-    p6.add_argument("--port", default=8765, type=int, help="Port")
+def _add_config(sub, argv: list[str] | None = None) -> None:
+    p = sub.add_parser("config", help="Config discovery and initialization")
+    config_sub = p.add_subparsers(dest="config_cmd", required=True)
+    wanted = _sniff_subcommand(argv or [])
+    if wanted in CONFIG_SUBCOMMANDS:
+        CONFIG_SUBCOMMANDS[wanted](config_sub)
+        return
+    for add in CONFIG_SUBCOMMANDS.values():
+        add(config_sub)
+
+
+def _add_web(sub) -> None:
+    p = sub.add_parser("web", help="Run local web control panel")
+    p.add_argument("--host", default="127.0.0.1", help="Host bind (default localhost only)")
+    p.add_argument("--port", default=8765, type=int, help="Port")
+
+
+SUBCOMMANDS = {
+    "import-master": _add_import_master,
+    "build-queue": _add_build_queue,
+    "run-queue": _add_run_queue,
+    "smoke-test": _add_smoke_test,
+    "config": _add_config,
+    "web": _add_web,
+}
+
+
+def build_parser(argv: list[str]) -> argparse.ArgumentParser:
+    """
+    Only the subparser named in argv is constructed; `--help`, a missing
+    command or an unknown one registers all of them so usage stays complete.
+    """
+    ap = argparse.ArgumentParser(prog="movieripper", description="MovieRipper (Windows, queue-driven movie ripping)")
+    ap.add_argument("-V", "--version", action="version", version=f"%(prog)s {__version__}")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    wanted = _sniff_subcommand(argv)
+    if wanted == "config":
+        _add_config(sub, argv[argv.index("config") + 1 :])
+    elif wanted in SUBCOMMANDS:
+        SUBCOMMANDS[wanted](sub)
+    else:
+        for add in SUBCOMMANDS.values():
+            add(sub)
+    return ap
+
+
+def main() -> None:
+    argv = sys.argv[1:]
+    # Answer the two trivial invocations without building any parser.
+    if argv in (["--version"], ["-V"]):
+        print(f"movieripper {__version__}")
+        return
+    if not argv:
+        print(f"usage: movieripper [-h] [-V] {{{','.join(SUBCOMMANDS)}}} ...", file=sys.stderr)
+        print("movieripper: error: the following arguments are required: cmd", file=sys.stderr)
+        raise SystemExit(2)
 
-    args = ap.parse_args()
+    ap = build_parser(argv)
+    args = ap.parse_args(argv)
 
     if args.cmd == "import-master":
-        build_index(args.csv, args.out)
+        from .clz_index import build_index
+
+        build_index(args.csv, args.out, pretty=args.pretty)
         print(f"Wrote index: {args.out}")
         return
 
     if args.cmd == "build-queue":
+        from .clz_index import load_index
+        from .queue_ui import QueueBuilderApp
+
         idx = load_index(args.index)
         app = QueueBuilderApp(idx, default_save_path=Path(args.out))
         app.mainloop()
         return
 
     if args.cmd == "run-queue":
+        from .config import load_config
+        from .logging_setup import configure_logging
+        from .watcher import run_queue
+
         cfg, _, _ = load_config(args.config)
         configure_logging(cfg.get("log_dir"))
         run_queue(cfg, args.queue)
@@ -119,6 +206,8 @@ def main() -> None:
 
     if args.cmd == "config":
         if args.config_cmd == "where":
+            from .config import CONFIG_NOT_FOUND_MESSAGE, resolve_config_path
+
             try:
                 path, reason = resolve_config_path(args.config)
             except FileNotFoundError:
@@ -126,6 +215,8 @@ def main() -> None:
             print(f"{path} ({reason})")
             return
         if args.config_cmd == "init":
+            from .config import init_config
+
             try:
                 target = init_config(args.path)
             except FileExistsError as exc:
@@ -1,17 +1,31 @@
 from __future__ import annotations
-import csv, json, re
+import codecs, csv, re
 from datetime import datetime, timezone
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import BinaryIO, Iterable, Optional
+
+from .jsonio import read_json, write_json
 
 IMDB_RE = re.compile(r"(tt\d{7,8})")
+_NONDIGIT = re.compile(r"\D")
+# Deletes every non-digit Latin-1 char; used for ASCII input, _NONDIGIT otherwise.
+_KEEP_DIGITS = str.maketrans({c: None for c in map(chr, range(256)) if not c.isdigit()})
 
 def extract_imdb_id(url: str | None) -> Optional[str]:
+    """Same result as IMDB_RE.search, via str.find (no Match objects per row)."""
     if not url:
         return None
-    m = IMDB_RE.search(url)
-    return m.group(1) if m else None
+    i = url.find("tt")
+    while i != -1:
+        j = i + 2
+        end = min(j + 8, len(url))
+        while j < end and url[j].isdecimal():  # isdecimal() == regex \d
+            j += 1
+        if j - i - 2 >= 7:
+            return url[i:j]
+        i = url.find("tt", i + 1)  # e.g. the "tt" in "https"
+    return None
 
 def normalize_barcode(val) -> Optional[str]:
     if val is None:
@@ -22,7 +36,7 @@ def normalize_barcode(val) -> Optional[str]:
     # CLZ export sometimes comes through as float-like e.g. 85392118823.0
     if s.endswith(".0") and s.replace(".","",1).isdigit():
         s = s[:-2]
-    digits = re.sub(r"\D", "", s)
+    digits = s.translate(_KEEP_DIGITS) if s.isascii() else _NONDIGIT.sub("", s)
     return digits if digits else None
 
 def normalize_index(val) -> Optional[int]:
@@ -46,41 +60,158 @@ class MovieRow:
     edition: str | None
     format: str | None
 
-def iter_movies_from_clz(csv_path: Path) -> Iterable[MovieRow]:
+CLZ_COLUMNS = ("Title", "Release Year", "IMDb Url", "Barcode", "Format", "Edition", "Index")
+_FLOAT_INT_RE = r"^(\d*)\.0$"  # "85392118823.0" -> "85392118823"
+
+def iter_movies_from_clz(csv_path: Path | BinaryIO) -> Iterable[MovieRow]:
     """
     Movies-only: expects CLZ export with at least:
       Title, Release Year, IMDb Url, Barcode, Format, Edition, Index
+    csv_path may also be a binary file object (e.g. an upload), read in place.
+    Uses pandas for the column-wise clean-up when installed, else csv.DictReader.
     """
+    try:
+        import pandas  # noqa: F401  (heavy; only imported when ingesting)
+    except ImportError:
+        return _iter_movies_csv(csv_path)
+    return _iter_movies_pandas(csv_path)
+
+def _iter_movies_csv(csv_path: Path | BinaryIO) -> Iterable[MovieRow]:
+    if hasattr(csv_path, "read"):
+        yield from _movie_rows(csv.DictReader(_decoded_lines(csv_path)))
+        return
     with csv_path.open("r", encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            title = (row.get("Title") or "").strip()
-            if not title:
-                continue
-            year_raw = (row.get("Release Year") or "").strip()
-            year = int(float(year_raw)) if year_raw and year_raw.lower() != "nan" else None
-            imdb_id = extract_imdb_id(row.get("IMDb Url"))
-            barcode = normalize_barcode(row.get("Barcode"))
-            edition = (row.get("Edition") or "").strip() or None
-            fmt = (row.get("Format") or "").strip() or None
-            clz_idx = normalize_index(row.get("Index"))
-            yield MovieRow(clz_index=clz_idx, title=title, year=year, imdb_id=imdb_id, barcode=barcode, edition=edition, format=fmt)
-
-def build_index(csv_path: str, out_path: str) -> dict:
-    p = Path(csv_path)
-    movies = list(iter_movies_from_clz(p))
-
-    by_imdb = {m.imdb_id: asdict(m) for m in movies if m.imdb_id}
+        yield from _movie_rows(csv.DictReader(f))
 
-    by_barcode: dict[str, list[dict]] = {}
-    for m in movies:
-        if m.barcode:
-            by_barcode.setdefault(m.barcode, []).append(asdict(m))
+def _decoded_lines(f: BinaryIO, chunk_size: int = 1 << 16) -> Iterable[str]:
+    """
+    utf-8-sig text lines from a binary file object, split on "\n" only (as
+    newline="" would). Needs nothing but read(): on Python 3.10 an upload's
+    SpooledTemporaryFile has no readable(), so io.TextIOWrapper can't wrap it.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    while chunk := f.read(chunk_size):
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+def _parse_year(raw: str | None) -> int | None:
+    # unparseable years become None, matching pd.to_numeric(errors="coerce")
+    try:
+        year = float((raw or "").strip())
+    except ValueError:
+        return None
+    return int(year) if year == year else None  # NaN != NaN
+
+def _movie_rows(reader: csv.DictReader) -> Iterable[MovieRow]:
+    for row in reader:
+        title = (row.get("Title") or "").strip()
+        if not title:
+            continue
+        year = _parse_year(row.get("Release Year"))
+        imdb_id = extract_imdb_id(row.get("IMDb Url"))
+        barcode = normalize_barcode(row.get("Barcode"))
+        edition = (row.get("Edition") or "").strip() or None
+        fmt = (row.get("Format") or "").strip() or None
+        clz_idx = normalize_index(row.get("Index"))
+        yield MovieRow(clz_index=clz_idx, title=title, year=year, imdb_id=imdb_id, barcode=barcode, edition=edition, format=fmt)
+
+def _iter_movies_pandas(csv_path: Path | BinaryIO) -> Iterable[MovieRow]:
+    import pandas as pd
+
+    try:
+        df = pd.read_csv(
+            csv_path,
+            usecols=lambda c: c in CLZ_COLUMNS,
+            dtype=str,
+            keep_default_na=False,
+            encoding="utf-8-sig",
+        )
+    except pd.errors.EmptyDataError:
+        return
+    df = df.reindex(columns=list(CLZ_COLUMNS), fill_value="")
+    df = df.apply(lambda col: col.str.strip())
+    df = df[df["Title"] != ""]
+
+    year = df["Release Year"].mask(df["Release Year"].str.lower() == "nan", "")
+    year = pd.to_numeric(year, errors="coerce")
+    imdb = df["IMDb Url"].str.extract(IMDB_RE.pattern, expand=False)
+    barcode = df["Barcode"].str.replace(_FLOAT_INT_RE, r"\1", regex=True).str.replace(r"\D", "", regex=True)
+    clz_idx = df["Index"].str.replace(_FLOAT_INT_RE, r"\1", regex=True)
+    clz_idx = clz_idx.where(clz_idx.str.fullmatch(r"\d+"), "")
 
-    # Simple search list (for UI)
-    search = []
-    for m in movies:
-        search.append({
+    for title, y, imdb_id, bc, edition, fmt, idx_s in zip(
+        df["Title"].tolist(),
+        year.tolist(),
+        imdb.tolist(),
+        barcode.tolist(),
+        df["Edition"].tolist(),
+        df["Format"].tolist(),
+        clz_idx.tolist(),
+    ):
+        yield MovieRow(
+            clz_index=int(idx_s) if idx_s else None,
+            title=title,
+            year=int(y) if y == y else None,  # NaN != NaN
+            imdb_id=imdb_id if isinstance(imdb_id, str) else None,
+            barcode=bc or None,
+            edition=edition or None,
+            format=fmt or None,
+        )
+
+NGRAM = 3  # postings are keyed by 3-char substrings of each key word
+
+def search_key(rec: dict) -> str:
+    """
+    Lowercased match string for a search row. Not stored in the index JSON
+    (it only repeats the row's fields); UIs build it once per session.
+    """
+    return f"{(rec.get('title') or '').lower()} {rec.get('year') or ''} {rec.get('imdb_id') or ''} {rec.get('barcode') or ''} {rec.get('clz_index') or ''}".strip()
+
+def key_ngrams(key: str) -> set[str]:
+    """Every NGRAM-char substring of every whitespace word in a search key."""
+    return {w[i:i + NGRAM] for w in key.split() for i in range(len(w) - NGRAM + 1)}
+
+def build_postings(keys: Iterable[str]) -> dict[str, list[int]]:
+    """n-gram -> ids of the keys containing it (ids are positions in `keys`)."""
+    postings: dict[str, list[int]] = {}
+    for i, key in enumerate(keys):
+        for g in key_ngrams(key):
+            postings.setdefault(g, []).append(i)
+    return postings
+
+def candidate_ids(postings: dict[str, list[int]], tokens: list[str]) -> Optional[set[int]]:
+    """
+    Superset of the keys containing every query token as a substring: a key
+    holding a token also holds each of the token's n-grams, so intersecting
+    their postings never drops a match (infix and digit-only tokens included).
+    Tokens shorter than NGRAM can't narrow; None means "scan everything".
+    Callers still confirm each candidate with the substring check.
+    """
+    ids: Optional[set[int]] = None
+    for t in tokens:
+        for i in range(len(t) - NGRAM + 1):
+            posting = postings.get(t[i:i + NGRAM], ())
+            ids = set(posting) if ids is None else ids.intersection(posting)
+            if not ids:
+                return ids
+    return ids
+
+def build_index(csv_path: str | Path | BinaryIO, out_path: str, pretty: bool = False) -> dict:
+    p = csv_path if hasattr(csv_path, "read") else Path(csv_path)
+
+    # One pass builds all three views; by_imdb/by_barcode/search share the row dicts.
+    by_imdb: dict[str, dict] = {}
+    by_barcode: dict[str, list[dict]] = {}
+    search = []  # simple search list (for UI)
+    for m in iter_movies_from_clz(p):
+        # MovieRow holds only scalars, so a flat literal beats asdict()'s deep copy
+        d = {
             "clz_index": m.clz_index,
             "title": m.title,
             "year": m.year,
@@ -88,8 +219,12 @@ def build_index(csv_path: str, out_path: str) -> dict:
             "barcode": m.barcode,
             "edition": m.edition,
             "format": m.format,
-            "search_key": f"{(m.title or '').lower()} {m.year or ''} {m.imdb_id or ''} {m.barcode or ''} {m.clz_index or ''}".strip()
-        })
+        }
+        if m.imdb_id:
+            by_imdb[m.imdb_id] = d
+        if m.barcode:
+            by_barcode.setdefault(m.barcode, []).append(d)
+        search.append(d)
 
     idx = {
         "schema_version": "movie_index_v2",
@@ -99,8 +234,9 @@ def build_index(csv_path: str, out_path: str) -> dict:
         "search": search,
         "items": search,
     }
-    Path(out_path).write_text(json.dumps(idx, indent=2), encoding="utf-8")
+    # compact by default: the index is machine-read and can run to several MB
+    write_json(out_path, idx, indent=pretty)
     return idx
 
 def load_index(path: str) -> dict:
-    return json.loads(Path(path).read_text(encoding="utf-8"))
+    return read_json(path)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-import json
+import copy
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping
+
+from .jsonio import loads
 
 CONFIG_NOT_FOUND_MESSAGE = "Copy config.example.json to config.json and edit paths."
 
@@ -13,28 +16,69 @@ ROOT_ALIASES: dict[str, tuple[str, ...]] = {
 }
 
 
-def _candidate_paths(cli_config: str | None = None) -> list[tuple[Path, str]]:
+# The home-directory candidate cannot change within a process; only the CLI
+# arg, env var and cwd vary per call.
+_STATIC_CANDIDATES: tuple[tuple[Path, str], ...] = (
+    (Path.home() / ".movieripper" / "config.json", "~/.movieripper/config.json"),
+)
+
+
+def _user_path(value: str) -> Path:
+    p = Path(value)
+    return p if p.is_absolute() else p.expanduser()
+
+
+def _candidate_paths(cli_config: str | None, env_path: str | None, cwd: Path) -> list[tuple[Path, str]]:
     candidates: list[tuple[Path, str]] = []
     if cli_config:
-        candidates.append((Path(cli_config).expanduser(), "cli --config"))
-    env_path = os.getenv("MOVIERIPPER_CONFIG")
+        candidates.append((_user_path(cli_config), "cli --config"))
     if env_path:
-        candidates.append((Path(env_path).expanduser(), "MOVIERIPPER_CONFIG env var"))
-    candidates.append((Path.cwd() / "config.json", "current working directory"))
-    candidates.append((Path.home() / ".movieripper" / "config.json", "~/.movieripper/config.json"))
+        candidates.append((_user_path(env_path), "MOVIERIPPER_CONFIG env var"))
+    candidates.append((cwd / "config.json", "current working directory"))
+    candidates.extend(_STATIC_CANDIDATES)
     return candidates
 
 
-def resolve_config_path(cli_config: str | None = None) -> tuple[Path, str]:
-    for path, reason in _candidate_paths(cli_config):
+@lru_cache(maxsize=8)
+def _resolve_cached(cli_config: str | None, env_path: str | None, cwd_str: str) -> tuple[str, str]:
+    for path, reason in _candidate_paths(cli_config, env_path, Path(cwd_str)):
         if path.exists():
-            return path, reason
+            return str(path), reason
+    # Raising keeps misses out of the cache, so a config created later is found.
     raise FileNotFoundError(CONFIG_NOT_FOUND_MESSAGE)
 
 
+def resolve_config_path(
+    cli_config: str | None = None,
+    *,
+    env: Mapping[str, str] | None = None,
+    cwd: str | Path | None = None,
+) -> tuple[Path, str]:
+    """
+    Resolution is memoized per (cli arg, MOVIERIPPER_CONFIG, cwd); only hits
+    are cached. Call `resolve_config_path.cache_clear()` to reset.
+    `env` and `cwd` default to os.environ and the process cwd.
+    """
+    env_path = (os.environ if env is None else env).get("MOVIERIPPER_CONFIG")
+    cwd_str = os.getcwd() if cwd is None else str(cwd)
+    path_str, reason = _resolve_cached(cli_config, env_path, cwd_str)
+    return Path(path_str), reason
+
+
+resolve_config_path.cache_clear = _resolve_cached.cache_clear  # type: ignore[attr-defined]
+
+_CONFIG_JSON_CACHE: dict[str, tuple[int, dict]] = {}
+
+
 def load_config(cli_config: str | None = None) -> tuple[dict, Path, str]:
     path, reason = resolve_config_path(cli_config)
-    return json.loads(path.read_text(encoding="utf-8")), path, reason
+    mtime_ns = path.stat().st_mtime_ns
+    cached = _CONFIG_JSON_CACHE.get(str(path))
+    if cached is None or cached[0] != mtime_ns:
+        cached = (mtime_ns, loads(path.read_bytes()))
+        _CONFIG_JSON_CACHE[str(path)] = cached
+    # Callers are free to mutate what they get back.
+    return copy.deepcopy(cached[1]), path, reason
 
 
 def resolve_path_setting(config_json: dict[str, Any], key: str) -> str | None:
@@ -48,12 +92,14 @@ def resolve_path_setting(config_json: dict[str, Any], key: str) -> str | None:
     return None
 
 
+def resolve_all_paths(config_json: dict[str, Any]) -> dict[str, str | None]:
+    """Every ROOT_ALIASES key resolved in one go (None where unset)."""
+    return {key: resolve_path_setting(config_json, key) for key in ROOT_ALIASES}
+
+
 def normalize_config(config_json: dict[str, Any]) -> dict[str, Any]:
     out = dict(config_json)
-    for key in ROOT_ALIASES:
-        resolved = resolve_path_setting(out, key)
-        if resolved:
-            out[key] = resolved
+    out.update({key: value for key, value in resolve_all_paths(config_json).items() if value})
     return out
 
 
@@ -62,6 +108,8 @@ def validate_config(config_json: dict[str, Any]) -> dict[str, Any]:
     errors: list[str] = []
     warnings: list[str] = []
     resolved_paths: dict[str, str] = {}
+    # each configured path is expanded and stat'ed once, then reused for `checks`
+    root_exists: dict[str, bool] = {}
 
     for key in ROOT_ALIASES:
         value = normalized.get(key)
@@ -71,19 +119,21 @@ def validate_config(config_json: dict[str, Any]) -> dict[str, Any]:
             )
             continue
         resolved_paths[key] = value
-        if not Path(value).expanduser().exists():
+        root_exists[key] = Path(value).expanduser().exists()
+        if not root_exists[key]:
             warnings.append(f"Configured path does not exist: {key} -> {value}")
 
     makemkv_cmd = normalized.get("makemkv_cmd")
+    final_root = resolved_paths.get("final_movies_root")
+    final_exists = root_exists.get("final_movies_root", False)
     checks = {
-        "rips_staging_root_exists": bool(resolved_paths.get("rips_staging_root"))
-        and Path(resolved_paths["rips_staging_root"]).expanduser().exists(),
-        "final_movies_root_exists": bool(resolved_paths.get("final_movies_root"))
-        and Path(resolved_paths["final_movies_root"]).expanduser().exists(),
+        "rips_staging_root_exists": root_exists.get("rips_staging_root", False),
+        "final_movies_root_exists": final_exists,
         "makemkv_exists": bool(makemkv_cmd)
         and Path(str(makemkv_cmd)).expanduser().exists(),
-        "final_parent_exists": bool(resolved_paths.get("final_movies_root"))
-        and Path(resolved_paths["final_movies_root"]).expanduser().parent.exists(),
+        # an existing final root implies its parent exists; skip the extra stat
+        "final_parent_exists": bool(final_root)
+        and (final_exists or Path(final_root).expanduser().parent.exists()),
     }
 
     return {
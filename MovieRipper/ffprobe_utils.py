@@ -1,10 +1,12 @@
 
 from __future__ import annotations
-import json, subprocess
+import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+from .jsonio import loads
+
 @dataclass
 class MediaInfo:
     path: str
@@ -17,25 +19,36 @@ class MediaInfo:
     audio_tracks: int
     subtitle_tracks: int
 
+# (path, st_mtime_ns, st_size) -> MediaInfo; an unchanged file is never re-probed
+_PROBE_CACHE: dict[tuple[str, int, int], MediaInfo] = {}
+
+def clear_probe_cache() -> None:
+    _PROBE_CACHE.clear()
+
 def run_ffprobe(ffprobe_cmd: str, file_path: str) -> dict:
     cmd = [
         ffprobe_cmd, "-v", "error",
         "-print_format", "json",
-        "-show_format",
-        "-show_streams",
+        # only the fields parse_media_info reads; full stream dumps are ~10x larger
+        "-show_entries", "format=duration,size:stream=codec_type,codec_name,width,height",
         file_path
     ]
     p = subprocess.run(cmd, capture_output=True, text=True)
     if p.returncode != 0:
         raise RuntimeError(f"ffprobe failed for {file_path}:\n{p.stderr}")
-    return json.loads(p.stdout)
+    return loads(p.stdout)
 
 def parse_media_info(file_path: str, ffprobe_cmd: str = "ffprobe") -> MediaInfo:
     fp = Path(file_path)
+    st = fp.stat()
+    key = (str(fp), st.st_mtime_ns, st.st_size)
+    cached = _PROBE_CACHE.get(key)
+    if cached is not None:
+        return cached
     data = run_ffprobe(ffprobe_cmd, str(fp))
     fmt = data.get("format", {})
     dur = float(fmt.get("duration") or 0.0)
-    size = int(fmt.get("size") or fp.stat().st_size)
+    size = int(fmt.get("size") or st.st_size)
     vcodec = None; w=None; h=None
     acodecs=[]
     a_tracks=0
@@ -52,7 +65,7 @@ def parse_media_info(file_path: str, ffprobe_cmd: str = "ffprobe") -> MediaInfo:
             if c: acodecs.append(c.lower())
         elif t == "subtitle":
             s_tracks += 1
-    return MediaInfo(
+    info = MediaInfo(
         path=str(fp),
         duration=dur,
         size_bytes=size,
@@ -63,3 +76,5 @@ def parse_media_info(file_path: str, ffprobe_cmd: str = "ffprobe") -> MediaInfo:
         audio_tracks=a_tracks,
         subtitle_tracks=s_tracks
     )
+    _PROBE_CACHE[key] = info
+    return info
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from threading import Event
+
+from .pipeline import _scandir_mtime_max
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # optional: pip install -e ".[watch]"
+    FileSystemEventHandler = object  # type: ignore[assignment,misc]
+    Observer = None
+
+POLL_SECONDS = 5
+
+# Reads are not writes: inotify reports opens and read-only closes, and those
+# must not hold off finalization (antivirus, Plex, Explorer thumbnails).
+_IGNORED_EVENTS = frozenset({"opened", "closed_no_write"})
+
+
+class _ActivityHandler(FileSystemEventHandler):
+    def __init__(self, watcher: "IdleWatcher"):
+        super().__init__()
+        self._watcher = watcher
+
+    def on_any_event(self, event) -> None:
+        if event.event_type not in _IGNORED_EVENTS:
+            self._watcher.activity.set()
+
+
+class IdleWatcher:
+    """
+    Waits for a rip folder to see no writes for `idle_seconds`.
+
+    Idleness is always decided from file mtimes. With watchdog installed,
+    filesystem notifications (ReadDirectoryChangesW / inotify) are only a
+    wake-up hint: a quiet folder is not re-walked at all, and a notified one is
+    re-checked by mtime, so access-time updates on Windows don't count as
+    writes. Without watchdog the folder is re-walked once per deadline.
+    """
+
+    def __init__(self, folder: Path, idle_seconds: int, stop_event: Event | None = None):
+        self.folder = Path(folder)
+        self.idle_seconds = idle_seconds
+        self.stop_event = stop_event
+        self.activity = Event()  # set by watchdog when something may have changed
+
+    def _sleep(self, seconds: float) -> bool:
+        """Sleep up to `seconds`; True if a stop was requested."""
+        if self.stop_event is not None:
+            return self.stop_event.wait(max(0.0, seconds))
+        time.sleep(max(0.0, seconds))
+        return False
+
+    def wait_until_idle(self, timeout: float) -> bool:
+        """True once the folder is idle; False on timeout or stop request."""
+        deadline = time.time() + timeout
+        if Observer is None:
+            return self._wait(deadline, notified=False)
+
+        observer = Observer()
+        try:
+            observer.schedule(_ActivityHandler(self), str(self.folder), recursive=True)
+            observer.start()
+        except OSError:
+            # out of inotify watches, unsupported filesystem, folder gone:
+            # the mtime poll still works, so don't fail the queue over it
+            return self._wait(deadline, notified=False)
+        try:
+            return self._wait(deadline, notified=True)
+        finally:
+            observer.stop()
+            observer.join()
+
+    def _wait(self, deadline: float, notified: bool) -> bool:
+        while True:
+            if self.stop_event is not None and self.stop_event.is_set():
+                return False
+            self.activity.clear()  # before the scan, so a write during it is not lost
+            newest = _scandir_mtime_max(self.folder)
+            now = time.time()
+            # an empty folder is never idle (same rule as is_idle)
+            idle_at = newest + self.idle_seconds if newest else now + POLL_SECONDS
+            if newest and idle_at <= now:
+                return True
+            if now >= deadline:
+                return False
+            if self._sleep(min(idle_at, deadline) - now):
+                return False
+            # No notification since the scan means no file changed, so the newest
+            # mtime still stands and the deadline we slept to has passed.
+            if notified and newest and not self.activity.is_set() and time.time() >= idle_at:
+                return True
+
+
+def wait_until_idle(path: Path, idle_seconds: int, timeout: float, stop_event: Event | None = None) -> bool:
+    """Block until `path` has been quiet for `idle_seconds` (see IdleWatcher)."""
+    return IdleWatcher(path, idle_seconds, stop_event=stop_event).wait_until_idle(timeout)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install -e ".[fast]"
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = True) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def read_json(path: str | Path) -> Any:
+    return loads(Path(path).read_bytes())
+
+
+# one entry per path, so a rewritten file replaces its stale parse
+_JSON_CACHE: dict[str, tuple[int, int, Any]] = {}
+
+
+def read_json_cached(path: str | Path, st: os.stat_result | None = None) -> Any:
+    """
+    read_json memoized per path on (mtime_ns, size), so a rewritten file is
+    re-parsed. The result is shared between callers; treat it as read-only.
+    Pass `st` when the caller has already stat'ed the file.
+    """
+    if st is None:
+        st = os.stat(path)
+    key = str(path)
+    cached = _JSON_CACHE.get(key)
+    if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+        cached = (st.st_mtime_ns, st.st_size, read_json(path))
+        _JSON_CACHE[key] = cached
+    return cached[2]
+
+
+def write_json(path: str | Path, obj: Any, indent: bool = True) -> None:
+    Path(path).write_bytes(dumps(obj, indent=indent))
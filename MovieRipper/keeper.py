@@ -1,7 +1,9 @@
 
 from __future__ import annotations
 import math, re
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Optional
 from .ffprobe_utils import parse_media_info, MediaInfo
@@ -13,6 +15,11 @@ def label_angle(path: str) -> Optional[int]:
     return int(m.group(1)) if m else None
 
 def audio_score(codecs: list[str]) -> int:
+    # titles from one disc tend to share codec layouts, so memoize per tuple
+    return _audio_score(tuple(codecs))
+
+@lru_cache(maxsize=256)
+def _audio_score(codecs: tuple[str, ...]) -> int:
     # very rough preference scoring
     score = 0
     for c in codecs:
@@ -25,8 +32,16 @@ def audio_score(codecs: list[str]) -> int:
         else: score += 5
     return score
 
-def pick_keeper(mkv_paths: Iterable[str], ffprobe_cmd: str, min_minutes: float, duration_tol: float, prefer_angle_1: bool) -> MediaInfo:
-    infos = [parse_media_info(p, ffprobe_cmd=ffprobe_cmd) for p in mkv_paths]
+def pick_keeper(mkv_paths: Iterable[str], ffprobe_cmd: str, min_minutes: float, duration_tol: float, prefer_angle_1: bool, executor: Optional[Executor] = None) -> MediaInfo:
+    # ffprobe runs out of process, so probes overlap fine on threads; map() keeps order.
+    # A caller-owned executor is reused across discs; otherwise a short-lived pool is made.
+    paths = list(mkv_paths)
+    probe = lambda p: parse_media_info(p, ffprobe_cmd=ffprobe_cmd)
+    if executor is not None:
+        infos = list(executor.map(probe, paths))
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(paths) or 1)) as ex:
+            infos = list(ex.map(probe, paths))
     # filter
     candidates = [i for i in infos if i.duration >= min_minutes*60]
     if not candidates:
@@ -49,5 +64,5 @@ def pick_keeper(mkv_paths: Iterable[str], ffprobe_cmd: str, min_minutes: float,
         bitrate = (i.size_bytes / max(i.duration, 1.0))  # bytes/sec
         return (bitrate / 1_000_000.0) + (audio_score(i.audio_codecs) / 10.0) + (i.subtitle_tracks * 0.1) + (i.audio_tracks * 0.05)
 
-    bucket_sorted = sorted(bucket, key=score, reverse=True)
-    return bucket_sorted[0]
+    # max() keeps the first of equal scores, same as the stable reverse sort did
+    return max(bucket, key=score)
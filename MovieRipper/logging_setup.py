@@ -1,21 +1,29 @@
 from __future__ import annotations
 
 import collections
+import itertools
 import logging
 import time
 from pathlib import Path
 
 
 class RingBufferHandler(logging.Handler):
+    """Keeps the last `capacity` records; they are only formatted when tail() is read."""
+
     def __init__(self, capacity: int = 1000):
         super().__init__()
-        self._records: collections.deque[str] = collections.deque(maxlen=capacity)
+        self._records: collections.deque[logging.LogRecord] = collections.deque(maxlen=capacity)
 
     def emit(self, record: logging.LogRecord) -> None:
-        self._records.append(self.format(record))
+        self._records.append(record)
 
     def tail(self, n: int = 200) -> list[str]:
-        return list(self._records)[-max(0, n) :]
+        # walk back from the newest record so only n are touched (n <= 0 means
+        # the whole buffer, as the old [-n:] slice gave for 0); the handler
+        # lock (held by emit) keeps the deque from mutating mid-iteration
+        with self.lock:
+            records = list(itertools.islice(reversed(self._records), n if n > 0 else None))
+        return [self.format(r) for r in reversed(records)]
 
 
 def configure_logging(log_dir: str | None = None, logger_name: str = "movieripper") -> tuple[logging.Logger, RingBufferHandler, Path | None]:
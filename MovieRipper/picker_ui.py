@@ -8,6 +8,7 @@ from typing import Optional, Callable
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from .clz_index import build_postings, candidate_ids, search_key
 from .pipeline import Job, write_job, JOB_FILENAME
 
 @dataclass
@@ -23,6 +24,8 @@ class PickerApp(tk.Tk):
 
         self.index = index
         self.pending_folders = pending_folders
+        self._search_keys = [search_key(rec) for rec in index.get("search", [])]
+        self._postings = build_postings(self._search_keys)  # in memory only, like QueueBuilderApp
 
         self.selected_folder: Optional[Path] = None
         self.selected_movie: Optional[dict] = None
@@ -90,21 +93,23 @@ class PickerApp(tk.Tk):
 
     def _refresh_results(self):
         q = (self.search_var.get() or "").strip().lower()
-        for i in self.tree.get_children():
-            self.tree.delete(i)
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
 
         # Basic fuzzy-ish: all query tokens must appear in search_key
         tokens = [t for t in q.split() if t]
-        results = []
-        for rec in self.index.get("search", []):
-            key = rec.get("search_key","")
-            if all(t in key for t in tokens):
-                results.append(rec)
-            if len(results) >= 250:
-                break
-
-        for rec in results[:250]:
-            self.tree.insert("", tk.END, values=(rec.get("title"), rec.get("year") or "", rec.get("imdb_id") or ""))
+        search = self.index.get("search", [])
+        ids = candidate_ids(self._postings, tokens)
+        row_ids = range(len(search)) if ids is None else sorted(ids)
+        count = 0
+        for i in row_ids:
+            if all(t in self._search_keys[i] for t in tokens):
+                rec = search[i]
+                self.tree.insert("", tk.END, values=(rec.get("title"), rec.get("year") or "", rec.get("imdb_id") or ""))
+                count += 1
+                if count >= 250:
+                    break
 
     def _on_movie_select(self, event=None):
         sel = self.tree.selection()
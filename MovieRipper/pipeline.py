@@ -1,9 +1,13 @@
+# NOTE: the hot paths here (mtime scans for idle_watch, staging moves) are I/O-bound; Numba @njit
+# would only add JIT overhead. Optimize via fewer syscalls and C-level string ops.
 from __future__ import annotations
-import json, shutil, time
+import os, re, shutil, time
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
+from .jsonio import read_json, write_json
 from .keeper import pick_keeper
 
 @dataclass
@@ -24,7 +28,7 @@ def load_job(folder: Path) -> Optional[Job]:
     p = folder / JOB_FILENAME
     if not p.exists():
         return None
-    data = json.loads(p.read_text(encoding="utf-8"))
+    data = read_json(p)
     return Job(
         clz_index=int(data["clz_index"]),
         title=data["title"],
@@ -33,31 +37,57 @@ def load_job(folder: Path) -> Optional[Job]:
     )
 
 def write_job(folder: Path, job: Job) -> None:
-    p = folder / JOB_FILENAME
-    p.write_text(json.dumps({
+    write_json(folder / JOB_FILENAME, {
         "clz_index": job.clz_index,
         "title": job.title,
         "year": job.year,
         "imdb_id": job.imdb_id
-    }, indent=2), encoding="utf-8")
+    })
+
+def _scandir_recursive(path: Path | str) -> Iterator[tuple[os.DirEntry, os.stat_result]]:
+    """
+    Yield (entry, stat) for every file under path. DirEntry caches its type, so
+    each file costs one stat instead of glob + is_file + stat. Entries removed
+    mid-walk (MakeMKV temp files) are skipped.
+    """
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from _scandir_recursive(entry.path)
+                    elif entry.is_file():
+                        yield entry, entry.stat()
+                except FileNotFoundError:
+                    continue
+    except FileNotFoundError:
+        return
+
+def _scan_mkvs(folder: Path | str) -> list[os.DirEntry]:
+    """Top-level .mkv files (any case, as glob matches on Windows); one scandir."""
+    with os.scandir(folder) as it:
+        return [e for e in it if e.name.lower().endswith(".mkv") and e.is_file(follow_symlinks=False)]
+
+def _scandir_mtime_max(path: Path | str) -> float:
+    """Newest file mtime under path (0.0 if none)."""
+    return max((st.st_mtime for _, st in _scandir_recursive(path)), default=0.0)
 
 def is_idle(folder: Path, idle_seconds: int) -> bool:
-    now = time.time()
-    latest = 0.0
-    for f in folder.glob("**/*"):
-        if f.is_file():
-            st = f.stat()
-            latest = max(latest, st.st_mtime)
-    if latest == 0:
-        return False
-    return (now - latest) >= idle_seconds
+    # Any file newer than the threshold settles it, so stop at the first one.
+    threshold = time.time() - idle_seconds
+    any_file = False
+    for _, st in _scandir_recursive(folder):
+        if st.st_mtime > threshold:
+            return False
+        any_file = True
+    return any_file
+
+_SAFE_NAME_TABLE = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+_MULTI_WS = re.compile(r"\s+")
 
 def safe_name(title: str) -> str:
-    bad = '<>:"/\\|?*'
-    out = ''.join('_' if c in bad else c for c in title)
-    while "  " in out:
-        out = out.replace("  ", " ")
-    return out.strip()
+    # one C-level pass each for the Windows-reserved chars and whitespace runs
+    return _MULTI_WS.sub(" ", title.translate(_SAFE_NAME_TABLE)).strip()
 
 def plex_base_name(job: Job) -> str:
     # Plex-safe base, with CLZ index in [brackets] (ignored by Plex) and IMDb tag in {curly braces}
@@ -68,6 +98,19 @@ def plex_base_name(job: Job) -> str:
     base += f" {{imdb-{job.imdb_id}}}"
     return safe_name(base)
 
+def _transfer(src: str, dest: Path, move: bool) -> None:
+    """
+    Same-volume moves are a rename (no bytes copied). Everything else goes
+    through shutil.copyfile, which uses the OS copy fast path, then copystat.
+    """
+    if move and os.stat(src).st_dev == os.stat(dest.parent).st_dev:
+        os.replace(src, dest)
+        return
+    shutil.copyfile(src, dest)
+    shutil.copystat(src, dest)
+    if move:
+        os.unlink(src)
+
 def process_rip_folder_to_staging(
     rip_folder: Path,
     staging_root: Path,
@@ -75,17 +118,22 @@ def process_rip_folder_to_staging(
     min_minutes_main: int,
     duration_tol: float,
     prefer_angle_1: bool,
-    move_mode: str
+    move_mode: str,
+    mkvs: list[str] | None = None,
+    executor: Executor | None = None,
 ) -> Path:
     """
     - Expects rip_folder to contain MKVs and a .movieripper.job.json
+    - mkvs: the caller's already-scanned MKV paths; globbed here when None
+    - executor: optional pool for the ffprobe calls (see pick_keeper)
     - Picks keeper
     - Creates: staging_root/<PlexFolderName>/PlexFileName.mkv
     """
     job = load_job(rip_folder)
     if not job:
         raise RuntimeError(f"No job file found in {rip_folder}.")
-    mkvs = [str(p) for p in rip_folder.glob("*.mkv")]
+    if mkvs is None:
+        mkvs = [e.path for e in _scan_mkvs(rip_folder)]
     if not mkvs:
         raise RuntimeError(f"No .mkv files found in {rip_folder}.")
 
@@ -94,7 +142,8 @@ def process_rip_folder_to_staging(
         ffprobe_cmd=ffprobe_cmd,
         min_minutes=min_minutes_main,
         duration_tol=duration_tol,
-        prefer_angle_1=prefer_angle_1
+        prefer_angle_1=prefer_angle_1,
+        executor=executor,
     )
 
     base = plex_base_name(job)
@@ -105,10 +154,7 @@ def process_rip_folder_to_staging(
     if dest_path.exists():
         raise RuntimeError(f"Destination already exists: {dest_path}")
 
-    if move_mode.lower() == "copy":
-        shutil.copy2(keeper.path, dest_path)
-    else:
-        shutil.move(keeper.path, dest_path)
+    _transfer(keeper.path, dest_path, move=move_mode.lower() != "copy")
 
     receipt = {
         "rip_folder": str(rip_folder),
@@ -119,5 +165,5 @@ def process_rip_folder_to_staging(
         "year": job.year,
         "imdb_id": job.imdb_id
     }
-    (rip_folder / ".movieripper.receipt.json").write_text(json.dumps(receipt, indent=2), encoding="utf-8")
+    write_json(rip_folder / ".movieripper.receipt.json", receipt)
     return dest_path
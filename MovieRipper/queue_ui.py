@@ -1,5 +1,7 @@
+# NOTE: _refresh_results is in-memory set intersection over n-gram postings plus
+# `in` checks on str, all already C-level; Numba @njit can't take str/dict/set
+# objects without costly conversion. Speed it up by narrowing candidates instead.
 from __future__ import annotations
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -7,6 +9,9 @@ from typing import Optional
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 
+from .clz_index import build_postings, candidate_ids, search_key
+from .jsonio import write_json
+
 @dataclass
 class QueueItem:
     clz_index: int
@@ -14,6 +19,17 @@ class QueueItem:
     year: int | None
     imdb_id: str
 
+class _Rec:
+    """Eligible search row; slots make per-keystroke attribute access cheap."""
+    __slots__ = ("clz_index", "title", "year", "imdb_id", "search_key")
+
+    def __init__(self, rec: dict):
+        self.clz_index = rec.get("clz_index")
+        self.title = rec.get("title")
+        self.year = rec.get("year")
+        self.imdb_id = rec.get("imdb_id")
+        self.search_key = search_key(rec)
+
 class QueueBuilderApp(tk.Tk):
     def __init__(self, index: dict, default_save_path: Optional[Path] = None):
         super().__init__()
@@ -25,6 +41,15 @@ class QueueBuilderApp(tk.Tk):
 
         self.selected_movie: Optional[dict] = None
         self.queue: list[QueueItem] = []
+        self._queue_clz: set[int] = set()
+        # Eligibility, search keys and the n-gram postings are built once
+        # here so a keystroke only intersects postings and confirms candidates.
+        self._records: list[_Rec] = [_Rec(rec) for rec in self._eligible_records()]
+        self._tree_values = [
+            (r.clz_index, r.title, r.year or "", r.imdb_id or "")
+            for r in self._records
+        ]
+        self._postings = build_postings(r.search_key for r in self._records)
 
         self._build_ui()
 
@@ -96,24 +121,23 @@ class QueueBuilderApp(tk.Tk):
         q = (self.search_var.get() or "").strip().lower()
         tokens = [t for t in q.split() if t]
 
-        for i in self.tree.get_children():
-            self.tree.delete(i)
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
 
-        results = []
-        for rec in self._eligible_records():
-            key = (rec.get("search_key") or "")
+        ids = candidate_ids(self._postings, tokens)
+        row_ids = range(len(self._records)) if ids is None else sorted(ids)
+        records = self._records
+        matches = []
+        for i in row_ids:
+            key = records[i].search_key
             if all(t in key for t in tokens):
-                results.append(rec)
-            if len(results) >= 300:
-                break
-
-        for rec in results[:300]:
-            self.tree.insert("", tk.END, values=(
-                rec.get("clz_index"),
-                rec.get("title"),
-                rec.get("year") or "",
-                rec.get("imdb_id") or ""
-            ))
+                matches.append(i)
+                if len(matches) >= 300:
+                    break
+
+        for i in matches:
+            self.tree.insert("", tk.END, values=self._tree_values[i])
 
     def _on_movie_select(self, event=None):
         sel = self.tree.selection()
@@ -134,10 +158,11 @@ class QueueBuilderApp(tk.Tk):
             return
         item = QueueItem(**self.selected_movie)
         # prevent dupes by clz_index
-        if any(q.clz_index == item.clz_index for q in self.queue):
+        if item.clz_index in self._queue_clz:
             messagebox.showinfo("MovieRipper", "That CLZ Index is already in the queue.")
             return
         self.queue.append(item)
+        self._queue_clz.add(item.clz_index)
         self.queue_list.insert(tk.END, self._label(item))
 
     def _add_and_next(self):
@@ -176,7 +201,7 @@ class QueueBuilderApp(tk.Tk):
         if not sel:
             return
         i = sel[0]
-        self.queue.pop(i)
+        self._queue_clz.discard(self.queue.pop(i).clz_index)
         self.queue_list.delete(i)
 
     def _save(self):
@@ -196,5 +221,5 @@ class QueueBuilderApp(tk.Tk):
             "built_at": __import__("datetime").datetime.now().isoformat(timespec="seconds"),
             "items": [it.__dict__ for it in self.queue]
         }
-        Path(path).write_text(json.dumps(data, indent=2), encoding="utf-8")
+        write_json(path, data)
         messagebox.showinfo("MovieRipper", f"Saved queue:\n{path}")
@@ -1,32 +1,145 @@
 from __future__ import annotations
+import ctypes
 import re
 import subprocess
 import time
 from pathlib import Path
-from typing import Optional
+from threading import Event
+from typing import Callable, Optional
 
 
 class MakeMKVError(RuntimeError):
     pass
 
 
+_RE_DRIVE_SPEC = re.compile(r"drive:([A-Za-z])")
+_RE_TCOUNT = re.compile(r"TCOUNT:(\d+)")
+
+
 def _run(cmd: list[str], timeout: Optional[int] = None) -> subprocess.CompletedProcess:
     return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
 
 
+ProgressCallback = Callable[[float], None]
+
+
+def _parse_prgv(line: bytes) -> Optional[float]:
+    # MakeMKV robot progress: PRGV:current,total,max -> overall percent
+    try:
+        _, total, maximum = line[5:].split(b",")[:3]
+        return 100.0 * int(total) / int(maximum) if int(maximum) else None
+    except ValueError:
+        return None
+
+
+def _run_streaming(
+    cmd: list[str],
+    log_path: Path,
+    on_progress: Optional[ProgressCallback] = None,
+) -> int:
+    """
+    Run cmd with stderr merged into stdout, writing raw bytes straight to
+    log_path so memory stays flat however chatty the tool is. Lines are read
+    as they arrive to report PRGV progress; the exit code is appended last.
+    """
+    with log_path.open("wb") as log:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            log.write(line)
+            if on_progress and line.startswith(b"PRGV:"):
+                pct = _parse_prgv(line)
+                if pct is not None:
+                    on_progress(pct)
+        rc = proc.wait()
+        log.write(f"\nRC={rc}\n".encode("ascii"))
+    return rc
+
+
 def _parse_drive_letter(disc_spec: str, configured_drive_letter: Optional[str]) -> str:
     if configured_drive_letter:
         letter = configured_drive_letter.strip().rstrip('\\').upper()
         if not letter.endswith(':'):
             letter += ':'
         return letter
-    m = re.match(r"drive:([A-Za-z])", str(disc_spec or ""))
+    m = _RE_DRIVE_SPEC.match(str(disc_spec or ""))
     if m:
         return f"{m.group(1).upper()}:"
     return "D:"
 
 
+DRIVE_CDROM = 5
+GENERIC_READ = 0x80000000
+FILE_SHARE_READ_WRITE = 0x3
+OPEN_EXISTING = 3
+IOCTL_STORAGE_EJECT_MEDIA = 0x2D4808
+
+_K32 = None
+
+
+def _kernel32():
+    """Private kernel32 handle with HANDLE-typed CreateFileW; None off Windows."""
+    global _K32
+    if _K32 is None and hasattr(ctypes, "WinDLL"):
+        from ctypes import wintypes
+
+        k32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        k32.CreateFileW.restype = wintypes.HANDLE
+        _K32 = k32
+    return _K32
+
+
+# drive letter -> (volume serial, True) for the disc MakeMKV last confirmed
+_MEDIA_STATE: dict[str, tuple[int, bool]] = {}
+
+
+def _drive_media_fast(drive_letter: str) -> Optional[tuple[bool, int]]:
+    """
+    (media present, volume serial) straight from kernel32, in microseconds.
+    None when the probe can't answer (not Windows, or not an optical drive).
+    """
+    k32 = _kernel32()
+    if k32 is None:
+        return None
+    root = f"{drive_letter}\\"
+    try:
+        if k32.GetDriveTypeW(root) != DRIVE_CDROM:
+            return None
+        serial = ctypes.c_uint32(0)
+        ok = k32.GetVolumeInformationW(root, None, 0, ctypes.byref(serial), None, None, None, 0)
+    except Exception:
+        return None
+    return bool(ok), serial.value
+
+
+def _eject_winapi(drive_letter: str) -> Optional[bool]:
+    """IOCTL_STORAGE_EJECT_MEDIA on the drive; None when not on Windows."""
+    k32 = _kernel32()
+    if k32 is None:
+        return None
+    from ctypes import wintypes
+
+    device = "\\\\.\\" + drive_letter
+    invalid = wintypes.HANDLE(-1).value
+    try:
+        h = k32.CreateFileW(device, GENERIC_READ, FILE_SHARE_READ_WRITE, None, OPEN_EXISTING, 0, None)
+        if not h or h == invalid:
+            return False
+        try:
+            returned = wintypes.DWORD()
+            return bool(k32.DeviceIoControl(
+                wintypes.HANDLE(h), IOCTL_STORAGE_EJECT_MEDIA, None, 0, None, 0, ctypes.byref(returned), None
+            ))
+        finally:
+            k32.CloseHandle(wintypes.HANDLE(h))
+    except Exception:
+        return False
+
+
 def _drive_has_media(drive_letter: str) -> bool:
+    fast = _drive_media_fast(drive_letter)
+    if fast is not None:
+        return fast[0]
     path = f"{drive_letter}\\"
     # On Windows, Test-Path is a practical signal for optical media presence.
     ps = f"if (Test-Path '{path}') {{ exit 0 }} else {{ exit 1 }}"
@@ -42,14 +155,31 @@ def _drive_has_media(drive_letter: str) -> bool:
         return False
 
 
-def _get_info_text(makemkv_cmd: str, disc_spec: str, timeout_seconds: int = 20) -> tuple[str, bool]:
+# disc_spec -> (time.time() of the probe, info text, timed out)
+_INFO_CACHE: dict[str, tuple[float, str, bool]] = {}
+INFO_MAX_AGE_SECONDS = 5.0
+
+
+def _get_info_text(
+    makemkv_cmd: str,
+    disc_spec: str,
+    timeout_seconds: int = 20,
+    max_age: float = INFO_MAX_AGE_SECONDS,
+) -> tuple[str, bool]:
+    """`makemkvcon info` output, reused for max_age seconds to avoid back-to-back launches."""
+    cached = _INFO_CACHE.get(disc_spec)
+    if cached and time.time() - cached[0] < max_age:
+        return cached[1], cached[2]
     try:
         p = _run([makemkv_cmd, "-r", "info", disc_spec], timeout=timeout_seconds)
     except subprocess.TimeoutExpired:
-        return "", True
+        txt, timed_out = "", True
     except Exception:
-        return "", False
-    return (p.stdout or "") + "\n" + (p.stderr or ""), False
+        txt, timed_out = "", False
+    else:
+        txt, timed_out = (p.stdout or "") + "\n" + (p.stderr or ""), False
+    _INFO_CACHE[disc_spec] = (time.time(), txt, timed_out)
+    return txt, timed_out
 
 
 def disc_present(
@@ -60,10 +190,37 @@ def disc_present(
 ) -> bool:
     """
     Returns True when MakeMKV sees titles, or when info timed out but drive media is present.
+    With a configured drive letter on Windows, MakeMKV is only consulted when the
+    volume in the drive changes; polls in between are a kernel32 call.
     """
+    if configured_drive_letter:
+        letter = _parse_drive_letter(disc_spec, configured_drive_letter)
+        fast = _drive_media_fast(letter)
+        if fast is not None:
+            has_media, serial = fast
+            if not has_media:
+                _MEDIA_STATE.pop(letter, None)
+                return False
+            known = _MEDIA_STATE.get(letter)
+            if known and known[0] == serial:
+                return known[1]
+            present = _disc_present_makemkv(makemkv_cmd, disc_spec, configured_drive_letter, info_timeout_seconds)
+            if present:  # a disc MakeMKV can't read yet is re-checked next poll
+                _MEDIA_STATE[letter] = (serial, present)
+            return present
+
+    return _disc_present_makemkv(makemkv_cmd, disc_spec, configured_drive_letter, info_timeout_seconds)
+
+
+def _disc_present_makemkv(
+    makemkv_cmd: str,
+    disc_spec: str,
+    configured_drive_letter: Optional[str],
+    info_timeout_seconds: int,
+) -> bool:
     txt, timed_out = _get_info_text(makemkv_cmd, disc_spec, timeout_seconds=info_timeout_seconds)
 
-    m = re.search(r"TCOUNT:(\d+)", txt)
+    m = _RE_TCOUNT.search(txt)
     if m:
         return int(m.group(1)) > 0
 
@@ -77,17 +234,42 @@ def disc_present(
     return False
 
 
+def disc_media_present_fast(drive_letter: Optional[str]) -> Optional[bool]:
+    """
+    Media present in the drive, from kernel32 alone (no makemkvcon). None when
+    no drive letter is configured or the probe is unavailable.
+    """
+    if not drive_letter:
+        return None
+    fast = _drive_media_fast(_parse_drive_letter("", drive_letter))
+    return None if fast is None else fast[0]
+
+
 def wait_for_disc(
     makemkv_cmd: str,
     disc_spec: str,
     poll_seconds: int = 3,
     configured_drive_letter: Optional[str] = None,
     max_wait_seconds: int = 0,
+    fast: bool = True,
 ) -> bool:
+    """
+    With `fast`, polls the cheap media probe and only asks MakeMKV to confirm
+    titles once media has been seen on two consecutive polls (debounce).
+    """
     t0 = time.time()
+    seen_media = 0
     while True:
-        if disc_present(makemkv_cmd, disc_spec, configured_drive_letter=configured_drive_letter):
-            return True
+        media = disc_media_present_fast(configured_drive_letter) if fast else None
+        if media is None:
+            if disc_present(makemkv_cmd, disc_spec, configured_drive_letter=configured_drive_letter):
+                return True
+        elif media:
+            seen_media += 1
+            if seen_media >= 2 and disc_present(makemkv_cmd, disc_spec, configured_drive_letter=configured_drive_letter):
+                return True
+        else:
+            seen_media = 0
         if max_wait_seconds and (time.time() - t0) > max_wait_seconds:
             return False
         time.sleep(poll_seconds)
@@ -96,17 +278,40 @@ def wait_for_disc(
 def wait_for_disc_removed(
     makemkv_cmd: str,
     disc_spec: str,
-    poll_seconds: int = 2,
+    poll_seconds: float | tuple[float, float, float] = 2,
     timeout_seconds: int = 0,
     configured_drive_letter: Optional[str] = None,
+    stop_event: Optional[Event] = None,
 ) -> bool:
+    """
+    True once the disc is gone; False on timeout or when stop_event is set.
+    poll_seconds may be a (start, cap, factor) triple to back off between
+    makemkvcon polls, e.g. (2, 10, 1.5) while waiting on a person to eject.
+    The kernel32 probe is cheap, so while it answers polls stay at `start`.
+    """
+    if isinstance(poll_seconds, tuple):
+        start, cap, factor = poll_seconds
+    else:
+        start, cap, factor = poll_seconds, poll_seconds, 1.0
+    backoff = start
     t0 = time.time()
     while True:
-        if not disc_present(makemkv_cmd, disc_spec, configured_drive_letter=configured_drive_letter):
+        media = disc_media_present_fast(configured_drive_letter)
+        if media is False:
             return True
+        if media is None:
+            if not disc_present(makemkv_cmd, disc_spec, configured_drive_letter=configured_drive_letter):
+                return True
+            delay, backoff = backoff, min(cap, backoff * factor)
+        else:
+            delay = start
         if timeout_seconds and (time.time() - t0) > timeout_seconds:
             return False
-        time.sleep(poll_seconds)
+        if stop_event is not None:
+            if stop_event.wait(delay):
+                return False
+        else:
+            time.sleep(delay)
 
 
 def rip_disc_all_titles(
@@ -114,11 +319,15 @@ def rip_disc_all_titles(
     disc_spec: str,
     out_dir: Path,
     min_length_seconds: int = 600,
-) -> tuple[int, str, str]:
+    on_progress: Optional[ProgressCallback] = None,
+) -> int:
+    """
+    Rips every title into out_dir and returns MakeMKV's exit code. Its output
+    (stdout and stderr, then RC=<code>) is streamed to out_dir/_makemkv.log.
+    """
     out_dir.mkdir(parents=True, exist_ok=True)
     cmd = [makemkv_cmd, "-r", "mkv", disc_spec, "all", str(out_dir), f"--minlength={int(min_length_seconds)}"]
-    p = _run(cmd)
-    return p.returncode, p.stdout, p.stderr
+    return _run_streaming(cmd, out_dir / "_makemkv.log", on_progress=on_progress)
 
 
 def try_eject(
@@ -127,8 +336,12 @@ def try_eject(
     disc_spec: Optional[str] = None,
 ) -> bool:
     """
-    Returns True if COM eject command appears successful.
+    Returns True if the eject appears successful: a direct IOCTL on Windows,
+    falling back to the Shell.Application COM verb via PowerShell.
     """
+    if disc_spec:
+        _INFO_CACHE.pop(disc_spec, None)  # the drive is about to change state
+
     # Keep optional MakeMKV eject attempt as a first pass.
     if makemkv_cmd and disc_spec:
         try:
@@ -136,6 +349,9 @@ def try_eject(
         except Exception:
             pass
 
+    if _eject_winapi(_parse_drive_letter("", drive_letter)):
+        return True
+
     try:
         ps = (
             "(New-Object -ComObject Shell.Application)"
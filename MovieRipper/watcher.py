@@ -1,27 +1,34 @@
 from __future__ import annotations
 
-import json
 import logging
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from threading import Event
 from typing import Callable
 
 from .config import normalize_config
-from .pipeline import Job, process_rip_folder_to_staging, safe_name, write_job
+from .idle_watch import wait_until_idle
+from .jsonio import read_json
+from .pipeline import Job, _scan_mkvs, process_rip_folder_to_staging, safe_name, write_job
 from .ripper import disc_present, rip_disc_all_titles, try_eject, wait_for_disc, wait_for_disc_removed
 
 
 StatusCallback = Callable[[dict], None]
 LogCallback = Callable[[str], None]
 
+# Shared across queue items; workers are only spawned on first use.
+_PROBE_POOL = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 2), thread_name_prefix="ffprobe")
+
 
 def _now_tag() -> str:
     return time.strftime("%Y%m%d_%H%M%S")
 
 
 def load_queue(path: str) -> list[dict]:
-    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    # not cached: callers own (and may mutate) the items they get back
+    data = read_json(path)
     items = data.get("items") or []
     if not isinstance(items, list):
         raise ValueError("Queue JSON missing 'items' list.")
@@ -94,17 +101,22 @@ def run_queue(
 
         emit("\n" + "=" * 90)
         emit(f"[{i}/{len(queue)}] Insert disc for: {title} ({year or ''})  CLZ={clz_index}  IMDb={imdb_id}")
-        update_status(step="waiting_for_disc", running=True, current=i, total=len(queue), title=title, clz_index=clz_index, imdb_id=imdb_id)
+        update_status(step="waiting_for_disc", running=True, current=i, total=len(queue), title=title, clz_index=clz_index, imdb_id=imdb_id, progress=None)
 
         if disc_present(makemkv_cmd, disc_spec, configured_drive_letter=drive_letter):
             emit("A disc is already detected in the drive.")
             emit("Please eject/remove it, then insert the correct disc for this queue item.")
-            while disc_present(makemkv_cmd, disc_spec, configured_drive_letter=drive_letter):
-                if should_stop():
-                    update_status(step="stopped", running=False)
-                    emit("Stop requested while waiting for current disc removal.")
-                    return
-                time.sleep(2)
+            wait_for_disc_removed(
+                makemkv_cmd,
+                disc_spec,
+                poll_seconds=(2, 10, 1.5),
+                configured_drive_letter=drive_letter,
+                stop_event=stop_event,
+            )
+            if should_stop():
+                update_status(step="stopped", running=False)
+                emit("Stop requested while waiting for current disc removal.")
+                return
 
         emit("Waiting for disc...")
         while not wait_for_disc(makemkv_cmd, disc_spec, poll_seconds=3, configured_drive_letter=drive_letter, max_wait_seconds=3):
@@ -120,15 +132,20 @@ def run_queue(
         job = Job(clz_index=clz_index, title=title, year=year, imdb_id=imdb_id)
         write_job(rip_folder, job)
 
-        update_status(step="ripping", running=True, current=i, total=len(queue), title=title, clz_index=clz_index, imdb_id=imdb_id)
+        update_status(step="ripping", running=True, current=i, total=len(queue), title=title, clz_index=clz_index, imdb_id=imdb_id, progress=0)
         emit(f"Ripping to {rip_folder}")
-        rc, out, err = rip_disc_all_titles(makemkv_cmd, disc_spec, rip_folder, min_length_seconds=min_length_seconds)
+        last_pct = -1
 
-        (rip_folder / "_makemkv_stdout.txt").write_text(out or "", encoding="utf-8", errors="ignore")
-        (rip_folder / "_makemkv_stderr.txt").write_text(err or "", encoding="utf-8", errors="ignore")
-        (rip_folder / "_makemkv_returncode.txt").write_text(str(rc), encoding="utf-8")
+        def on_progress(pct: float) -> None:
+            nonlocal last_pct
+            if int(pct) != last_pct:  # PRGV arrives many times per percent
+                last_pct = int(pct)
+                update_status(progress=last_pct)
 
-        mkvs = list(rip_folder.glob("*.mkv"))
+        rip_disc_all_titles(makemkv_cmd, disc_spec, rip_folder, min_length_seconds=min_length_seconds, on_progress=on_progress)
+        update_status(progress=None)  # status updates merge; don't show 100% past the rip
+
+        mkvs = _scan_mkvs(rip_folder)
         if not mkvs:
             emit("No MKVs found after rip. Skipping this item (check logs in RIP_PREP folder).")
             if auto_eject:
@@ -137,18 +154,11 @@ def run_queue(
 
         update_status(step="finalizing", running=True, current=i, total=len(queue), title=title, clz_index=clz_index, imdb_id=imdb_id)
         emit("Finalizing rip (waiting for folder to go idle)...")
-        t0 = time.time()
-        while time.time() - t0 < 1800:
-            from .pipeline import is_idle
-
-            if should_stop():
-                update_status(step="stopped", running=False)
-                emit("Stop requested during finalization wait.")
-                return
-
-            if is_idle(rip_folder, idle_seconds=idle_seconds):
-                break
-            time.sleep(5)
+        wait_until_idle(rip_folder, idle_seconds, timeout=1800, stop_event=stop_event)
+        if should_stop():
+            update_status(step="stopped", running=False)
+            emit("Stop requested during finalization wait.")
+            return
 
         update_status(step="moving", running=True, current=i, total=len(queue), title=title, clz_index=clz_index, imdb_id=imdb_id)
         emit("Selecting main feature and moving to staging...")
@@ -160,6 +170,8 @@ def run_queue(
             duration_tol=duration_tol,
             prefer_angle_1=prefer_angle_1,
             move_mode=move_mode,
+            mkvs=[e.path for e in mkvs],
+            executor=_PROBE_POOL,
         )
         emit(f"Done: {dest}")
 
@@ -167,24 +179,18 @@ def run_queue(
             update_status(step="ejecting", running=True, current=i, total=len(queue), title=title, clz_index=clz_index, imdb_id=imdb_id)
             ejected = try_eject(drive_letter=drive_letter, makemkv_cmd=makemkv_cmd, disc_spec=disc_spec)
             emit("Eject requested. Waiting for disc to be removed...")
-            removed = False
-            t0 = time.time()
-            while True:
-                if should_stop():
-                    update_status(step="stopped", running=False)
-                    emit("Stop requested during eject/removal wait.")
-                    return
-                removed = wait_for_disc_removed(
-                    makemkv_cmd,
-                    disc_spec,
-                    poll_seconds=2,
-                    timeout_seconds=2,
-                    configured_drive_letter=drive_letter,
-                )
-                if removed:
-                    break
-                if time.time() - t0 > 60:
-                    break
+            removed = wait_for_disc_removed(
+                makemkv_cmd,
+                disc_spec,
+                poll_seconds=2,
+                timeout_seconds=60,
+                configured_drive_letter=drive_letter,
+                stop_event=stop_event,
+            )
+            if should_stop():
+                update_status(step="stopped", running=False)
+                emit("Stop requested during eject/removal wait.")
+                return
 
             if not ejected or not removed:
                 emit("Warning: eject could not be confirmed. Please eject manually, then continue with the next disc.")
@@ -1,24 +1,32 @@
 from __future__ import annotations
 
+import asyncio
 import json
-import tempfile
+import os
 import threading
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
+import jinja2
 from fastapi import FastAPI, File, Form, HTTPException, Request, UploadFile
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 
 from MovieRipper import __version__
 from MovieRipper.clz_index import build_index
-from MovieRipper.config import CONFIG_NOT_FOUND_MESSAGE, normalize_config, resolve_path_setting, validate_config
+from MovieRipper.config import CONFIG_NOT_FOUND_MESSAGE, normalize_config, resolve_all_paths, validate_config
+from MovieRipper.jsonio import dumps, read_json_cached, write_json
 from MovieRipper.logging_setup import configure_logging
+from MovieRipper.pipeline import safe_name
 from MovieRipper.watcher import load_queue, run_queue
 
 
-def _job_folder_preview(queue_path: str, staging_root: str) -> str | None:
+@lru_cache(maxsize=8)
+def _job_folder_preview(queue_path: str, mtime_ns: int, staging_root: str) -> str | None:
+    """Keyed on the queue file's mtime so repeated polls skip the queue parse."""
     try:
         queue = load_queue(queue_path)
     except Exception:
@@ -32,18 +40,23 @@ def _job_folder_preview(queue_path: str, staging_root: str) -> str | None:
     if clz_index is None:
         return None
     folder_name = f"{int(clz_index)}_{title}_<timestamp>"
-    from MovieRipper.pipeline import safe_name
-
     return str(Path(staging_root) / safe_name(folder_name))
 
 
-def _load_config_from_path(path: str) -> dict:
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    try:
+        return path.stat()
+    except OSError:
+        return None
+
+
+def _load_config_from_path(path: str) -> tuple[dict, dict]:
+    """Returns (normalized config, validation report) from one validate_config pass."""
     config_path = Path(path)
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
-    cfg = json.loads(config_path.read_text(encoding="utf-8"))
-    report = validate_config(cfg)
-    return report["normalized_config"]
+    report = validate_config(read_json_cached(config_path))
+    return report["normalized_config"], report
 
 
 class RunState:
@@ -51,13 +64,29 @@ class RunState:
         self.lock = threading.Lock()
         self.thread: threading.Thread | None = None
         self.stop_event = threading.Event()
-        self.status: dict = {"running": False, "step": "idle"}
+        # Writers swap in a new read-only snapshot under `lock`; readers need no lock.
+        self.status: MappingProxyType = MappingProxyType({"running": False, "step": "idle"})
         self.logger, self.ring, _ = configure_logging(None, logger_name="movieripper.web")
 
+    def update_status(self, update: dict) -> None:
+        with self.lock:
+            self.status = MappingProxyType({**self.status, **update})
+
 
 STATE = RunState()
 BASE_DIR = Path(__file__).resolve().parent
-TEMPLATES = Jinja2Templates(directory=str(BASE_DIR / "templates"))
+# Templates ship with the package, so skip the per-render mtime check and keep
+# compiled bytecode across restarts (per-user temp dir). Set MOVIERIPPER_WEB_DEBUG=1
+# while editing templates.
+_TEMPLATES_DEBUG = os.getenv("MOVIERIPPER_WEB_DEBUG") == "1"
+TEMPLATES = Jinja2Templates(
+    env=jinja2.Environment(
+        loader=jinja2.FileSystemLoader(str(BASE_DIR / "templates")),
+        autoescape=True,
+        auto_reload=_TEMPLATES_DEBUG,
+        bytecode_cache=None if _TEMPLATES_DEBUG else jinja2.FileSystemBytecodeCache(),
+    )
+)
 
 
 class QueueSaveRequest(BaseModel):
@@ -89,6 +118,74 @@ class RunPathCheckRequest(BaseModel):
     index_path: str = "MovieRipper/movie_index.json"
 
 
+def _run_paths_report(
+    queue_path: Path,
+    config_path: Path,
+    index_path: Path,
+    queue_st: os.stat_result | None,
+    config_st: os.stat_result | None,
+    index_st: os.stat_result | None,
+) -> dict:
+    config_valid = False
+    config_errors: list[str] = []
+    config_warnings: list[str] = []
+    staging_root = None
+    final_root = None
+
+    if config_st is not None:
+        try:
+            config_json = read_json_cached(config_path, config_st)
+            report = validate_config(config_json)
+            config_valid = bool(report["valid"])
+            config_errors = report["errors"]
+            config_warnings = report["warnings"]
+            staging_root = report["resolved"].get("rips_staging_root")
+            final_root = report["resolved"].get("final_movies_root")
+        except json.JSONDecodeError as exc:
+            config_errors = [f"Invalid JSON in config file: {exc}"]
+
+    job_folder_preview = None
+    if staging_root and queue_st is not None:
+        job_folder_preview = _job_folder_preview(str(queue_path), queue_st.st_mtime_ns, staging_root)
+
+    return {
+        "queue_path": str(queue_path),
+        "queue_exists": queue_st is not None,
+        "config_path": str(config_path),
+        "config_exists": config_st is not None,
+        "config_valid": config_valid,
+        "config_errors": config_errors,
+        "config_warnings": config_warnings,
+        "staging_root": staging_root,
+        "final_root": final_root,
+        "job_folder_preview": job_folder_preview,
+        "index_path": str(index_path),
+        "index_exists": index_st is not None,
+    }
+
+
+def _run_paths_etag(
+    config_path: Path,
+    queue_st: os.stat_result | None,
+    config_st: os.stat_result | None,
+    index_st: os.stat_result | None,
+) -> str:
+    """
+    Weak validator for the run/paths report: the three files' mtimes plus
+    whether the configured roots exist (the report warns on missing roots).
+    """
+    parts = [st.st_mtime_ns if st is not None else 0 for st in (queue_st, config_st, index_st)]
+    if config_st is not None:
+        try:
+            config_json = read_json_cached(config_path, config_st)
+        except json.JSONDecodeError:
+            config_json = None
+        if isinstance(config_json, dict):
+            for root in resolve_all_paths(config_json).values():
+                parts.append(int(bool(root) and Path(root).expanduser().exists()))
+    return 'W/"' + "-".join(map(str, parts)) + '"'
+
+
 def create_app() -> FastAPI:
     app = FastAPI(title="MovieRipper Web")
     app.mount("/static", StaticFiles(directory=str(BASE_DIR / "static")), name="static")
@@ -119,8 +216,7 @@ def create_app() -> FastAPI:
 
     @app.get("/api/v1/status")
     def api_status():
-        with STATE.lock:
-            return dict(STATE.status)
+        return dict(STATE.status)
 
     @app.get("/api/v1/logs")
     def api_logs(tail: int = 200):
@@ -128,37 +224,38 @@ def create_app() -> FastAPI:
 
     @app.post("/api/v1/import")
     async def api_import(csv_file: UploadFile = File(...), out_path: str = Form("MovieRipper/movie_index.json")):
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".csv") as tmp:
-            tmp.write(await csv_file.read())
-            temp_path = Path(tmp.name)
-        try:
-            index = build_index(str(temp_path), out_path)
-        finally:
-            temp_path.unlink(missing_ok=True)
+        # UploadFile is spooled (memory, then disk); build_index reads it in place,
+        # on a worker thread so status/log polls keep being served meanwhile
+        index = await asyncio.to_thread(build_index, csv_file.file, out_path)
         rows = index.get("search", [])
-        eligible = [r for r in rows if r.get("imdb_id") and r.get("clz_index") is not None]
+        eligible = missing_imdb = missing_clz = 0
+        for r in rows:
+            imdb = r.get("imdb_id")
+            clz = r.get("clz_index")
+            if not imdb:
+                missing_imdb += 1
+            if clz is None:
+                missing_clz += 1
+            elif imdb:
+                eligible += 1
         return {
             "out_path": out_path,
             "total_rows": len(rows),
-            "eligible": len(eligible),
-            "missing_imdb_id": len([r for r in rows if not r.get("imdb_id")]),
-            "missing_clz_index": len([r for r in rows if r.get("clz_index") is None]),
+            "eligible": eligible,
+            "missing_imdb_id": missing_imdb,
+            "missing_clz_index": missing_clz,
         }
 
     @app.post("/api/v1/queue/save")
     def api_queue_save(req: QueueSaveRequest):
-        seen: set[int] = set()
-        deduped: list[dict] = []
+        by_idx: dict[int, dict] = {}
         for item in req.items:
-            idx = int(item["clz_index"])
-            if idx in seen:
-                continue
-            seen.add(idx)
-            deduped.append(item)
+            by_idx.setdefault(int(item["clz_index"]), item)  # first occurrence wins
+        deduped = list(by_idx.values())
         payload = {"items": deduped}
         path = Path(req.out_path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        write_json(path, payload, indent=False)  # machine-read only (load_queue)
         return {"saved": len(deduped), "out_path": str(path)}
 
     @app.post("/api/v1/run/start")
@@ -169,30 +266,25 @@ def create_app() -> FastAPI:
 
             resolved_config_path = config_path or "config.json"
             try:
-                cfg = _load_config_from_path(resolved_config_path)
+                cfg, report = _load_config_from_path(resolved_config_path)
             except FileNotFoundError:
                 raise HTTPException(status_code=400, detail=CONFIG_NOT_FOUND_MESSAGE)
             except json.JSONDecodeError as exc:
                 raise HTTPException(status_code=400, detail=f"Invalid JSON in config: {exc}") from exc
 
-            report = validate_config(cfg)
             if not report["valid"]:
                 raise HTTPException(status_code=400, detail="; ".join(report["errors"]))
 
             STATE.logger, STATE.ring, _ = configure_logging(cfg.get("log_dir"), logger_name="movieripper")
             STATE.stop_event.clear()
-            STATE.status = {"running": True, "step": "starting", "queue_path": queue_path}
-
-            def _status_callback(update: dict) -> None:
-                with STATE.lock:
-                    STATE.status.update(update)
+            STATE.status = MappingProxyType({"running": True, "step": "starting", "queue_path": queue_path})
 
             t = threading.Thread(
                 target=run_queue,
                 kwargs={
                     "cfg": cfg,
                     "queue_path": queue_path,
-                    "status_callback": _status_callback,
+                    "status_callback": STATE.update_status,
                     "stop_event": STATE.stop_event,
                 },
                 daemon=True,
@@ -203,49 +295,32 @@ def create_app() -> FastAPI:
 
     @app.post("/api/v1/run/paths")
     def api_run_paths(req: RunPathCheckRequest):
-        queue_path = Path(req.queue_path)
-        config_path = Path(req.config_path)
-        index_path = Path(req.index_path)
-
-        config_exists = config_path.exists()
-        config_valid = False
-        config_errors: list[str] = []
-        config_warnings: list[str] = []
-        staging_root = None
-        final_root = None
-
-        if config_exists:
-            try:
-                config_json = json.loads(config_path.read_text(encoding="utf-8"))
-                report = validate_config(config_json)
-                config_valid = bool(report["valid"])
-                config_errors = report["errors"]
-                config_warnings = report["warnings"]
-                staging_root = report["resolved"].get("rips_staging_root")
-                final_root = report["resolved"].get("final_movies_root")
-            except json.JSONDecodeError as exc:
-                config_errors = [f"Invalid JSON in config file: {exc}"]
-
-        return {
-            "queue_path": str(queue_path),
-            "queue_exists": queue_path.exists(),
-            "config_path": str(config_path),
-            "config_exists": config_exists,
-            "config_valid": config_valid,
-            "config_errors": config_errors,
-            "config_warnings": config_warnings,
-            "staging_root": staging_root,
-            "final_root": final_root,
-            "job_folder_preview": _job_folder_preview(str(queue_path), staging_root) if staging_root and queue_path.exists() else None,
-            "index_path": str(index_path),
-            "index_exists": index_path.exists(),
-        }
+        paths = (Path(req.queue_path), Path(req.config_path), Path(req.index_path))
+        # one stat per path; the config/queue stats also key the parse caches
+        return _run_paths_report(*paths, *(_stat_or_none(p) for p in paths))
+
+    @app.get("/api/v1/run/paths")
+    def api_run_paths_get(
+        request: Request,
+        response: Response,
+        queue_path: str = "MovieRipper/movie_queue.json",
+        config_path: str = "config.json",
+        index_path: str = "MovieRipper/movie_index.json",
+    ):
+        # GET so the browser revalidates with If-None-Match; unchanged -> 304, no work
+        paths = (Path(queue_path), Path(config_path), Path(index_path))
+        stats = tuple(_stat_or_none(p) for p in paths)
+        etag = _run_paths_etag(paths[1], *stats)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
+        return _run_paths_report(*paths, *stats)
 
     @app.post("/api/v1/run/stop")
     def api_run_stop():
         STATE.stop_event.set()
-        with STATE.lock:
-            STATE.status.update({"running": False, "step": "stopped"})
+        STATE.update_status({"running": False, "step": "stopped"})
         return {"stopping": True}
 
     @app.post("/api/v1/config/save")
@@ -253,13 +328,9 @@ def create_app() -> FastAPI:
         out = Path(req.path)
         out.parent.mkdir(parents=True, exist_ok=True)
 
-        normalized = normalize_config(req.config_json)
-        for key in ("rips_staging_root", "final_movies_root"):
-            resolved = resolve_path_setting(req.config_json, key)
-            if resolved:
-                normalized[key] = resolved
+        normalized = normalize_config(req.config_json)  # already carries resolve_all_paths()
 
-        out.write_text(json.dumps(normalized, indent=2), encoding="utf-8")
+        write_json(out, normalized)
         return {"saved": str(out), "config_json": normalized}
 
     @app.post("/api/v1/config/load")
@@ -268,7 +339,7 @@ def create_app() -> FastAPI:
         if not path.exists():
             raise HTTPException(status_code=404, detail=f"Config file not found: {path}")
         try:
-            config_json = json.loads(path.read_text(encoding="utf-8"))
+            config_json = read_json_cached(path)
         except json.JSONDecodeError as exc:
             raise HTTPException(status_code=400, detail=f"Invalid JSON in config file: {exc}") from exc
 
@@ -287,7 +358,7 @@ def create_app() -> FastAPI:
             raise HTTPException(status_code=404, detail=f"Index file not found: {path}")
 
         try:
-            index_data = json.loads(path.read_text(encoding="utf-8"))
+            index_data = read_json_cached(path)
         except json.JSONDecodeError as exc:
             raise HTTPException(status_code=400, detail=f"Invalid JSON in index file: {exc}") from exc
 
@@ -299,12 +370,18 @@ def create_app() -> FastAPI:
             raise HTTPException(status_code=422, detail="Index JSON must include list key 'items' or 'search'.")
 
         total = len(source_items)
-        missing_imdb = len([item for item in source_items if not item.get("imdb_id")])
+        missing_imdb = 0
+        eligible: list[dict] = []
+        for item in source_items:
+            if not item.get("imdb_id"):
+                missing_imdb += 1
+            elif item.get("clz_index") is not None:
+                eligible.append(item)
 
         if req.eligible_only:
-            source_items = [item for item in source_items if item.get("imdb_id") and item.get("clz_index") is not None]
+            source_items = eligible
 
-        return {
+        payload = {
             "path": str(path),
             "total": total,
             "eligible_only": req.eligible_only,
@@ -312,5 +389,7 @@ def create_app() -> FastAPI:
             "missing_imdb_count": missing_imdb,
             "loaded_count": len(source_items),
         }
+        # the item list can be large; serialize it directly (orjson when installed)
+        return Response(content=dumps(payload, indent=False), media_type="application/json")
 
     return app
@@ -0,0 +1,19 @@
+"""Shared test data (plain module; imported by test files, not collected)."""
+
+SAMPLE_CSV = (
+    b"Title,Release Year,IMDb Url,Barcode,Format,Edition,Index\n"
+    b"Movie A,2000,https://www.imdb.com/title/tt1234567/,123,DVD,,10\n"
+)
+
+SAMPLE_INDEX = {
+    "items": [
+        {"title": "Movie A", "year": 2000, "clz_index": 10, "imdb_id": "tt1234567"},
+        {"title": "Movie B", "year": 2001, "clz_index": None, "imdb_id": None},
+    ]
+}
+
+
+def sample_csv(rows: int) -> bytes:
+    """SAMPLE_CSV with its data row repeated; built on demand (100k rows is ~6.7 MB)."""
+    header, row = SAMPLE_CSV.split(b"\n", 1)
+    return header + b"\n" + row * rows
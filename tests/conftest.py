@@ -1,4 +1,53 @@
 from pathlib import Path
 import sys
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from _fixtures import SAMPLE_INDEX  # noqa: E402
+
+# The web UI is an optional extra: gate its tests once here rather than per
+# module, without skipping the rest of the suite when fastapi is absent.
+try:
+    import fastapi  # noqa: F401
+except ImportError:
+    collect_ignore = ["test_webapp.py"]
+
+
+def pytest_addoption(parser):
+    parser.addoption("--runslow", action="store_true", help="also run tests marked slow")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: large-input cases, skipped unless --runslow")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow; pass --runslow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One web app + TestClient for the whole session (fastapi imported lazily)."""
+    from fastapi.testclient import TestClient
+
+    from MovieRipper.webapp.app import create_app
+
+    with TestClient(create_app()) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def sample_index_path(tmp_path_factory):
+    """Read-only index file shared by the session; copy it before mutating."""
+    from MovieRipper.jsonio import write_json
+
+    path = tmp_path_factory.mktemp("idx") / "movie_index.json"
+    write_json(path, SAMPLE_INDEX, indent=False)
+    return path
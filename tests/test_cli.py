@@ -0,0 +1,25 @@
+from MovieRipper.__main__ import build_parser
+
+
+def _registered_commands(ap):
+    sub = next(a for a in ap._actions if a.dest == "cmd")
+    return set(sub.choices)
+
+
+def test_build_parser_only_registers_sniffed_subcommand():
+    ap = build_parser(["smoke-test", "--config", "cfg.json"])
+    assert _registered_commands(ap) == {"smoke-test"}
+    args = ap.parse_args(["smoke-test", "--config", "cfg.json"])
+    assert args.config == "cfg.json"
+
+
+def test_build_parser_registers_all_for_help_or_unknown():
+    for argv in ([], ["--help"], ["nope"]):
+        assert "web" in _registered_commands(build_parser(argv))
+        assert "import-master" in _registered_commands(build_parser(argv))
+
+
+def test_build_parser_config_subcommand():
+    args = build_parser(["config", "init", "--path", "x.json"]).parse_args(["config", "init", "--path", "x.json"])
+    assert args.config_cmd == "init"
+    assert args.path == "x.json"
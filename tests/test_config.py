@@ -1,7 +1,11 @@
-from MovieRipper.config import resolve_config_path, validate_config
+import os
 
+import pytest
 
-def test_config_discovery_env_beats_cwd(tmp_path, monkeypatch):
+from MovieRipper.config import load_config, resolve_config_path, validate_config
+
+
+def test_config_discovery_env_beats_cwd(tmp_path):
     cwd = tmp_path / "cwd"
     cwd.mkdir()
     (cwd / "config.json").write_text("{}", encoding="utf-8")
@@ -9,42 +13,64 @@ def test_config_discovery_env_beats_cwd(tmp_path, monkeypatch):
     env_cfg = tmp_path / "env_config.json"
     env_cfg.write_text("{}", encoding="utf-8")
 
-    monkeypatch.chdir(cwd)
-    monkeypatch.setenv("MOVIERIPPER_CONFIG", str(env_cfg))
-
-    resolved, reason = resolve_config_path(None)
+    resolved, reason = resolve_config_path(None, env={"MOVIERIPPER_CONFIG": str(env_cfg)}, cwd=cwd)
     assert resolved == env_cfg
     assert "env var" in reason
 
 
-def test_config_discovery_cli_beats_env(tmp_path, monkeypatch):
+def test_config_discovery_cli_beats_env(tmp_path):
     env_cfg = tmp_path / "env_config.json"
     env_cfg.write_text("{}", encoding="utf-8")
     cli_cfg = tmp_path / "cli_config.json"
     cli_cfg.write_text("{}", encoding="utf-8")
-    monkeypatch.setenv("MOVIERIPPER_CONFIG", str(env_cfg))
 
-    resolved, reason = resolve_config_path(str(cli_cfg))
+    resolved, reason = resolve_config_path(str(cli_cfg), env={"MOVIERIPPER_CONFIG": str(env_cfg)}, cwd=tmp_path)
     assert resolved == cli_cfg
     assert "cli" in reason
 
 
-def test_validate_config_accepts_legacy_alias_keys(tmp_path):
-    cfg = {
+def _legacy_alias_cfg(tmp_path):
+    return {
         "rip_prep_root": str(tmp_path / "rip"),
         "rip_staging_root": str(tmp_path / "final"),
         "makemkv_cmd": str(tmp_path / "makemkvcon64.exe"),
     }
-    report = validate_config(cfg)
 
-    assert report["valid"] is True
+
+def _check_legacy_aliases(report, cfg):
     assert report["resolved"]["rips_staging_root"] == cfg["rip_prep_root"]
     assert report["resolved"]["final_movies_root"] == cfg["rip_staging_root"]
-    assert report["warnings"]
+    assert report["warnings"]  # the tmp roots do not exist
 
 
-def test_validate_config_requires_new_roots_or_aliases():
-    report = validate_config({"makemkv_cmd": "makemkvcon64.exe"})
-    assert report["valid"] is False
+def _check_missing_roots(report, cfg):
     assert any("rips_staging_root" in err for err in report["errors"])
     assert any("final_movies_root" in err for err in report["errors"])
+
+
+@pytest.mark.parametrize(
+    "cfg_builder,expected_valid,check",
+    [
+        (_legacy_alias_cfg, True, _check_legacy_aliases),
+        (lambda tmp_path: {"makemkv_cmd": "makemkvcon64.exe"}, False, _check_missing_roots),
+    ],
+    ids=["legacy-alias-keys", "requires-roots-or-aliases"],
+)
+def test_validate_config_cases(tmp_path, cfg_builder, expected_valid, check):
+    cfg = cfg_builder(tmp_path)
+    report = validate_config(cfg)
+    assert report["valid"] is expected_valid
+    check(report, cfg)
+
+
+def test_load_config_reparses_after_file_changes(tmp_path):
+    cfg = tmp_path / "config.json"
+    cfg.write_text('{"idle_seconds": 1}', encoding="utf-8")
+    first, _, _ = load_config(str(cfg))
+    first["idle_seconds"] = 99
+    assert load_config(str(cfg))[0]["idle_seconds"] == 1
+
+    cfg.write_text('{"idle_seconds": 2}', encoding="utf-8")
+    st = cfg.stat()
+    os.utime(cfg, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert load_config(str(cfg))[0]["idle_seconds"] == 2
@@ -0,0 +1,32 @@
+from MovieRipper import ffprobe_utils
+
+
+def test_parse_media_info_reuses_probe_for_unchanged_file(tmp_path, monkeypatch):
+    mkv = tmp_path / "title_t00.mkv"
+    mkv.write_bytes(b"x" * 10)
+    calls = []
+
+    def fake_ffprobe(cmd, path):
+        calls.append(path)
+        return {
+            "format": {"duration": "5400.0"},
+            "streams": [
+                {"codec_type": "video", "codec_name": "H264", "width": 1920, "height": 1080},
+                {"codec_type": "audio", "codec_name": "AC3"},
+            ],
+        }
+
+    monkeypatch.setattr(ffprobe_utils, "run_ffprobe", fake_ffprobe)
+    ffprobe_utils.clear_probe_cache()
+
+    first = ffprobe_utils.parse_media_info(str(mkv))
+    second = ffprobe_utils.parse_media_info(str(mkv))
+    assert first == second
+    assert first.size_bytes == 10
+    assert first.video_codec == "h264"
+    assert first.audio_codecs == ["ac3"]
+    assert len(calls) == 1
+
+    mkv.write_bytes(b"x" * 20)
+    assert ffprobe_utils.parse_media_info(str(mkv)).size_bytes == 20
+    assert len(calls) == 2
@@ -1,19 +1,106 @@
-import json
+import pytest
 
-from MovieRipper.clz_index import build_index
+from _fixtures import SAMPLE_CSV
+from MovieRipper.clz_index import IMDB_RE, build_index, build_postings, candidate_ids, extract_imdb_id, search_key
+from MovieRipper.jsonio import loads
 
 
 def test_import_master_schema_fields(tmp_path):
     csv_path = tmp_path / "master.csv"
     out_path = tmp_path / "index.json"
-    csv_path.write_text(
-        "Title,Release Year,IMDb Url,Barcode,Format,Edition,Index\nMovie A,2000,https://www.imdb.com/title/tt1234567/,123,DVD,,10\n",
-        encoding="utf-8",
-    )
+    csv_path.write_bytes(SAMPLE_CSV)
     index = build_index(str(csv_path), str(out_path))
-    saved = json.loads(out_path.read_text(encoding="utf-8"))
+    saved = loads(out_path.read_bytes())
 
     assert index["schema_version"] == "movie_index_v2"
     assert "generated_at" in index
     assert index["items"] == index["search"]
     assert saved["schema_version"] == "movie_index_v2"
+
+
+def test_pandas_ingest_matches_csv_reader(tmp_path):
+    pytest.importorskip("pandas")
+    from MovieRipper.clz_index import _iter_movies_csv, _iter_movies_pandas
+
+    csv_path = tmp_path / "master.csv"
+    csv_path.write_text(
+        "Title,Release Year,IMDb Url,Barcode,Format,Edition,Index\n"
+        "Movie A,2000,https://www.imdb.com/title/tt1234567/,123,DVD,,10\n"
+        " Movie B ,2001.0,nope,85392118823.0, Blu-ray ,Special,11.0\n"
+        ",1999,,,,,\n"
+        "C,nan,tt123,12-34 5,,,abc\n"
+        "D,abc,,,,,12\n",
+        encoding="utf-8",
+    )
+    assert list(_iter_movies_pandas(csv_path)) == list(_iter_movies_csv(csv_path))
+
+
+def test_candidate_ids_never_drop_substring_matches(tmp_path):
+    csv_path = tmp_path / "master.csv"
+    csv_path.write_text(
+        "Title,Release Year,IMDb Url,Barcode,Format,Edition,Index\n"
+        "The Matrix,1999,https://www.imdb.com/title/tt0133093/,,DVD,,1\n"
+        "Heat,1995,https://www.imdb.com/title/tt0113277/,,DVD,,2\n"
+        "Spider-Man,2002,https://www.imdb.com/title/tt0145487/,,DVD,,3\n"
+        "Manhattan,1979,https://www.imdb.com/title/tt0079522/,,DVD,,4\n",
+        encoding="utf-8",
+    )
+    index = build_index(str(csv_path), str(tmp_path / "index.json"))
+    assert "token_index" not in index  # postings are built in memory by the UIs
+    keys = [search_key(rec) for rec in index["search"]]
+    postings = build_postings(keys)
+
+    queries = ["man", "pider", "0145487", "14548", "matrix", "he 1995", "at", "x", "zzz", "spider man", ""]
+    for q in queries:
+        tokens = q.split()
+        expected = {i for i, key in enumerate(keys) if all(t in key for t in tokens)}
+        ids = candidate_ids(postings, tokens)
+        rows = range(len(keys)) if ids is None else ids
+        assert {i for i in rows if all(t in keys[i] for t in tokens)} == expected, q
+    assert candidate_ids(postings, ["man"]) == {2, 3}
+    assert candidate_ids(postings, ["x"]) is None
+
+
+def test_extract_imdb_id_matches_regex():
+    samples = [
+        None,
+        "",
+        "https://www.imdb.com/title/tt0133093/",
+        "http://imdb.com/title/tt12345678/?ref=x",
+        "tt123456789",
+        "tt123456",
+        "https://www.imdb.com/title/tt123/ then tt7654321",
+        "attt1234567",
+    ]
+    for url in samples:
+        m = IMDB_RE.search(url) if url else None
+        assert extract_imdb_id(url) == (m.group(1) if m else None)
+
+
+def test_ingest_reads_binary_file_objects(tmp_path):
+    import io
+    import tempfile
+
+    from MovieRipper.clz_index import _iter_movies_csv, iter_movies_from_clz
+
+    data = b"\xef\xbb\xbfTitle,Release Year,IMDb Url,Barcode,Format,Edition,Index\nMovie A,2000,tt1234567,123,DVD,,10\n"
+    csv_path = tmp_path / "master.csv"
+    csv_path.write_bytes(data)
+    expected = list(_iter_movies_csv(csv_path))
+
+    buf = io.BytesIO(data)
+    assert list(_iter_movies_csv(buf)) == expected
+    assert not buf.closed
+    assert list(iter_movies_from_clz(io.BytesIO(data))) == expected
+
+    # what UploadFile.file is; on 3.10 it has no readable(), so TextIOWrapper fails on it
+    with tempfile.SpooledTemporaryFile() as spooled:
+        spooled.write(data)
+        spooled.seek(0)
+        assert list(_iter_movies_csv(spooled)) == expected
+
+    # quoted field spanning lines, CRLF endings, and reads split mid-character
+    from MovieRipper.clz_index import _decoded_lines
+
+    text = 'Title,Index\r\n"Am\u00e9lie\nline two",1\r\n'
+    assert "".join(_decoded_lines(io.BytesIO(text.encode("utf-8-sig")), chunk_size=3)) == text
@@ -0,0 +1,17 @@
+import os
+
+from MovieRipper.jsonio import _JSON_CACHE, read_json_cached
+
+
+def test_read_json_cached_reuses_parse_until_file_changes(tmp_path):
+    path = tmp_path / "queue.json"
+    path.write_text('{"items": [1]}', encoding="utf-8")
+    first = read_json_cached(path)
+    assert read_json_cached(path) is first
+    entries = len(_JSON_CACHE)
+
+    path.write_text('{"items": [1, 2]}', encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert read_json_cached(path) == {"items": [1, 2]}
+    assert len(_JSON_CACHE) == entries  # the rewrite replaced the stale parse
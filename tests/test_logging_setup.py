@@ -0,0 +1,17 @@
+import logging
+
+from MovieRipper.logging_setup import RingBufferHandler
+
+
+def test_ring_buffer_tail_returns_newest_records_in_order():
+    handler = RingBufferHandler(capacity=5)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger = logging.getLogger("movieripper.test_ring")
+    logger.propagate = False
+    logger.addHandler(handler)
+    for i in range(8):
+        logger.warning("line %d", i)
+
+    assert handler.tail(3) == ["line 5", "line 6", "line 7"]
+    assert handler.tail(50) == [f"line {i}" for i in range(3, 8)]
+    assert handler.tail(0) == [f"line {i}" for i in range(3, 8)]
@@ -0,0 +1,97 @@
+import os
+import threading
+import time
+from threading import Event
+
+from MovieRipper.idle_watch import IdleWatcher
+from MovieRipper.pipeline import _scan_mkvs, _transfer, is_idle, safe_name
+
+
+def test_is_idle_uses_newest_nested_file(tmp_path):
+    assert is_idle(tmp_path, idle_seconds=1) is False  # empty folder is never idle
+
+    old = tmp_path / "a.mkv"
+    old.write_bytes(b"x")
+    past = time.time() - 600
+    os.utime(old, (past, past))
+    assert is_idle(tmp_path, idle_seconds=60) is True
+
+    nested = tmp_path / "sub"
+    nested.mkdir()
+    (nested / "b.mkv").write_bytes(b"x")
+    assert is_idle(tmp_path, idle_seconds=60) is False
+
+
+def test_idle_watcher_returns_for_already_idle_folder(tmp_path):
+    mkv = tmp_path / "a.mkv"
+    mkv.write_bytes(b"x")
+    past = time.time() - 600
+    os.utime(mkv, (past, past))
+    assert IdleWatcher(tmp_path, idle_seconds=60).wait_until_idle(timeout=5) is True
+
+
+def test_idle_watcher_falls_back_to_polling_when_observer_fails(tmp_path, monkeypatch):
+    import MovieRipper.idle_watch as idle_watch
+
+    class BrokenObserver:
+        def schedule(self, *args, **kwargs):
+            raise OSError(28, "inotify watch limit reached")
+
+    monkeypatch.setattr(idle_watch, "Observer", BrokenObserver)
+    mkv = tmp_path / "a.mkv"
+    mkv.write_bytes(b"x")
+    past = time.time() - 600
+    os.utime(mkv, (past, past))
+    assert IdleWatcher(tmp_path, idle_seconds=60).wait_until_idle(timeout=5) is True
+
+
+def test_idle_watcher_honours_stop_event(tmp_path):
+    (tmp_path / "a.mkv").write_bytes(b"x")
+    stop = Event()
+    stop.set()
+    assert IdleWatcher(tmp_path, idle_seconds=60, stop_event=stop).wait_until_idle(timeout=5) is False
+
+
+def test_scan_mkvs_matches_extension_case_insensitively(tmp_path):
+    for name in ("title_t00.mkv", "TITLE_T01.MKV", "notes.txt"):
+        (tmp_path / name).write_bytes(b"x")
+    (tmp_path / "dir.mkv").mkdir()
+    assert sorted(e.name for e in _scan_mkvs(tmp_path)) == ["TITLE_T01.MKV", "title_t00.mkv"]
+
+
+def test_safe_name_replaces_reserved_chars_and_collapses_whitespace():
+    assert safe_name('Alien: Director\'s Cut  <1979>?') == "Alien_ Director's Cut _1979__"
+    assert safe_name("  A/B\\C   \t D  ") == "A_B_C D"
+
+
+def test_transfer_renames_on_same_volume_and_copies_otherwise(tmp_path):
+    src = tmp_path / "a.mkv"
+    src.write_bytes(b"x" * 16)
+    moved = tmp_path / "moved.mkv"
+    _transfer(str(src), moved, move=True)
+    assert moved.read_bytes() == b"x" * 16 and not src.exists()
+
+    copied = tmp_path / "copied.mkv"
+    _transfer(str(moved), copied, move=False)
+    assert copied.read_bytes() == moved.read_bytes()
+
+
+def test_idle_watcher_ignores_reads(tmp_path):
+    f = tmp_path / "a.mkv"
+    f.write_bytes(b"x")
+    past = time.time() - 2
+    os.utime(f, (past, past))
+
+    def keep_reading():  # like an AV scan or Plex probing the new file
+        for _ in range(15):
+            f.read_bytes()
+            time.sleep(0.1)
+
+    reader = threading.Thread(target=keep_reading)
+    reader.start()
+    try:
+        t0 = time.time()
+        assert IdleWatcher(tmp_path, idle_seconds=3).wait_until_idle(timeout=6) is True
+        assert time.time() - t0 < 3
+    finally:
+        reader.join()
@@ -0,0 +1,98 @@
+import subprocess
+import sys
+
+from MovieRipper import ripper
+
+
+def test_disc_present_only_asks_makemkv_when_volume_changes(monkeypatch):
+    probes = iter([(True, 111), (True, 111), (False, 0), (True, 222)])
+    makemkv_calls = []
+
+    monkeypatch.setattr(ripper, "_drive_media_fast", lambda letter: next(probes))
+
+    def fake_makemkv(*args):
+        makemkv_calls.append(args)
+        return True
+
+    monkeypatch.setattr(ripper, "_disc_present_makemkv", fake_makemkv)
+    ripper._MEDIA_STATE.clear()
+
+    results = [ripper.disc_present("makemkvcon64.exe", "disc:0", configured_drive_letter="E:") for _ in range(4)]
+    assert results == [True, True, False, True]
+    assert len(makemkv_calls) == 2
+
+
+def test_disc_present_falls_back_to_makemkv_without_fast_probe(monkeypatch):
+    monkeypatch.setattr(ripper, "_drive_media_fast", lambda letter: None)
+    monkeypatch.setattr(ripper, "_get_info_text", lambda *a, **k: ("TCOUNT:3\n", False))
+    assert ripper.disc_present("makemkvcon64.exe", "disc:0", configured_drive_letter="E:") is True
+
+
+def test_run_streaming_writes_output_and_reports_progress(tmp_path):
+    script = "import sys; print('MSG:hello', flush=True); print('PRGV:0,32768,65536'); sys.stderr.write('oops')"
+    seen = []
+    rc = ripper._run_streaming(
+        [sys.executable, "-c", script],
+        tmp_path / "_makemkv.log",
+        on_progress=seen.append,
+    )
+    assert rc == 0
+    log = (tmp_path / "_makemkv.log").read_bytes()
+    assert b"MSG:hello" in log and b"oops" in log
+    assert log.endswith(b"RC=0\n")
+    assert seen == [50.0]
+
+
+def test_get_info_text_reuses_recent_probe(monkeypatch):
+    calls = []
+
+    def fake_run(cmd, timeout=None):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout="TCOUNT:1", stderr="")
+
+    monkeypatch.setattr(ripper, "_run", fake_run)
+    ripper._INFO_CACHE.clear()
+    assert ripper._get_info_text("makemkvcon64.exe", "disc:9")[0].startswith("TCOUNT:1")
+    ripper._get_info_text("makemkvcon64.exe", "disc:9")
+    assert len(calls) == 1
+    ripper._get_info_text("makemkvcon64.exe", "disc:9", max_age=0)
+    assert len(calls) == 2
+
+
+def test_wait_for_disc_debounces_fast_probe_before_confirming(monkeypatch):
+    probes = iter([False, True, True])
+    confirms = []
+    monkeypatch.setattr(ripper, "disc_media_present_fast", lambda letter: next(probes))
+    monkeypatch.setattr(ripper, "disc_present", lambda *a, **k: confirms.append(1) or True)
+    monkeypatch.setattr(ripper.time, "sleep", lambda s: None)
+
+    assert ripper.wait_for_disc("makemkvcon64.exe", "disc:0", configured_drive_letter="E:") is True
+    assert len(confirms) == 1
+
+
+def test_wait_for_disc_removed_returns_false_when_stopped(monkeypatch):
+    from threading import Event
+
+    stop = Event()
+    stop.set()
+    monkeypatch.setattr(ripper, "disc_media_present_fast", lambda letter: True)
+    assert ripper.wait_for_disc_removed("makemkvcon64.exe", "disc:0", configured_drive_letter="E:", stop_event=stop) is False
+
+
+def test_wait_for_disc_removed_backs_off_only_for_makemkv_polls(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(ripper.time, "sleep", sleeps.append)
+
+    # no fast probe: every poll is a makemkvcon launch, so the delay grows to the cap
+    present = iter([True] * 5 + [False])
+    monkeypatch.setattr(ripper, "disc_media_present_fast", lambda letter: None)
+    monkeypatch.setattr(ripper, "disc_present", lambda *a, **k: next(present))
+    assert ripper.wait_for_disc_removed("makemkvcon64.exe", "disc:0", poll_seconds=(2, 10, 1.5))
+    assert sleeps == [2, 3.0, 4.5, 6.75, 10]
+
+    # fast probe answering: polls stay at the start interval
+    sleeps.clear()
+    probes = iter([True] * 5 + [False])
+    monkeypatch.setattr(ripper, "disc_media_present_fast", lambda letter: next(probes))
+    assert ripper.wait_for_disc_removed("makemkvcon64.exe", "disc:0", poll_seconds=(2, 10, 1.5), configured_drive_letter="E:")
+    assert sleeps == [2] * 5